@@ -63,6 +63,7 @@ class CLI:
                 self.buffer = None
                 self.featcount = None
                 self.debug = None
+                self.workers = None
 
                 # Parse flags for different commands
                 i = 2
@@ -109,6 +110,13 @@ class CLI:
                         except ValueError:
                             print("ERROR: --featcount requires a number (maximum features to process)")
                             i += 2
+                    elif sys.argv[i] == '--workers' and i + 1 < len(sys.argv):
+                        try:
+                            self.workers = int(sys.argv[i + 1])
+                            i += 2
+                        except ValueError:
+                            print("ERROR: --workers requires a number (parallel sanitize processes)")
+                            i += 2
                     elif sys.argv[i] == '--debug':
                         self.debug = True
                         i += 1
@@ -149,6 +157,8 @@ class CLI:
         print("  --backup-uploaded  Backup GDBs after successful upload to data/gdbs/backup (upload command)")
         print("  --do-overlap-fix     Perform overlapping pairs fixing in sanitize command")
         print("  --remove-slivers     Remove sliver polygons using Eliminate tool in sanitize command")
+        print("  --workers N          Sanitize N GDBs in parallel worker processes (sanitize command)")
+        print("                       With one GDB, resolve its overlapping pairs with N workers")
         print
         print("Logging:")
         print("  All console output is logged to data/log.txt with timestamps")
@@ -169,6 +179,7 @@ class CLI:
         print("  python main.py sanitize --do-overlap-fix     # Perform overlap fixing")
         print("  python main.py sanitize --buffer-erase 20   # Use 20cm buffer distance (recommended)")
         print("  python main.py sanitize --remove-slivers    # Remove sliver polygons using Eliminate")
+        print("  python main.py sanitize --workers 4         # Sanitize 4 GDBs at a time")
         print("  python main.py clear              # Clear GDB files (default)")
         print("  python main.py clear --gdbs       # Clear GDB files")
         print("  python main.py clear --logs       # Clear log file")
@@ -600,7 +611,7 @@ class CLI:
 
         # Process sanitize column
         from src.proc import DataWorkflows
-        return DataWorkflows.process_sanitize_column(gdbs_folder, None, buffer_erase_cm=args.buffer_erase, do_overlap_fix=args.do_overlap_fix, remove_slivers=args.remove_slivers)
+        return DataWorkflows.process_sanitize_column(gdbs_folder, None, buffer_erase_cm=args.buffer_erase, do_overlap_fix=args.do_overlap_fix, remove_slivers=args.remove_slivers, workers=args.workers)
 
     def _run_clear(self, args):
         """Run clear command with support for --gdbs and --logs flags"""
@@ -8,6 +8,10 @@ Data processing for CSV parsing and hierarchical data management
 import csv
 import os
 from datetime import datetime
+from itertools import islice
+
+# Workflow column headers in data.csv, each optionally followed by a status column
+DATA_COLUMNS = frozenset(('prepare', 'validate', 'sanitize', 'upload'))
 
 # Simple console functions
 def print_error(msg):
@@ -113,48 +117,49 @@ class DataProc:
                 reader = csv.reader(f)
                 headers = next(reader)
 
-                prepare_idx = validate_idx = sanitize_idx = upload_idx = -1
-                prepare_status_idx = validate_status_idx = sanitize_status_idx = upload_status_idx = -1
+                column_idx = {}
                 for i, header in enumerate(headers):
                     header_lower = header.lower()
-                    if header_lower == 'prepare':
-                        prepare_idx = i
-                    elif header_lower == 'validate':
-                        validate_idx = i
-                    elif header_lower == 'sanitize':
-                        sanitize_idx = i
-                    elif header_lower == 'upload':
-                        upload_idx = i
+                    if header_lower in DATA_COLUMNS:
+                        column_idx[header_lower] = i
                     elif header_lower == 'status' and i > 0:
                         # Determine which status column this is based on previous column
-                        if i == prepare_idx + 1:
-                            prepare_status_idx = i
-                        elif i == validate_idx + 1:
-                            validate_status_idx = i
-                        elif i == sanitize_idx + 1:
-                            sanitize_status_idx = i
-                        elif i == upload_idx + 1:
-                            upload_status_idx = i
+                        previous_lower = headers[i - 1].lower()
+                        if previous_lower in DATA_COLUMNS:
+                            column_idx[previous_lower + '_status'] = i
+
+                prepare_idx = column_idx.get('prepare', -1)
+                validate_idx = column_idx.get('validate', -1)
+                sanitize_idx = column_idx.get('sanitize', -1)
+                upload_idx = column_idx.get('upload', -1)
+                prepare_status_idx = column_idx.get('prepare_status', -1)
+                validate_status_idx = column_idx.get('validate_status', -1)
+                sanitize_status_idx = column_idx.get('sanitize_status', -1)
+                upload_status_idx = column_idx.get('upload_status', -1)
+
+                # Rows shorter than the right-most known column are skipped
+                min_row_len = max(prepare_idx, validate_idx, sanitize_idx, upload_idx,
+                                  prepare_status_idx, validate_status_idx, sanitize_status_idx, upload_status_idx) + 1
 
                 for row in reader:
-                    if len(row) > max(prepare_idx, validate_idx, sanitize_idx, upload_idx,
-                                  prepare_status_idx, validate_status_idx, sanitize_status_idx, upload_status_idx):
-                        if prepare_idx >= 0 and row[prepare_idx]:
-                            data['prepare'].append(row[prepare_idx].strip())
-                            if prepare_status_idx >= 0 and len(row) > prepare_status_idx:
-                                data['prepare_status'].append(row[prepare_status_idx].strip())
-                        if validate_idx >= 0 and row[validate_idx]:
-                            data['validate'].append(row[validate_idx].strip())
-                            if validate_status_idx >= 0 and len(row) > validate_status_idx:
-                                data['validate_status'].append(row[validate_status_idx].strip())
-                        if sanitize_idx >= 0 and row[sanitize_idx]:
-                            data['sanitize'].append(row[sanitize_idx].strip())
-                            if sanitize_status_idx >= 0 and len(row) > sanitize_status_idx:
-                                data['sanitize_status'].append(row[sanitize_status_idx].strip())
-                        if upload_idx >= 0 and row[upload_idx]:
-                            data['upload'].append(row[upload_idx].strip())
-                            if upload_status_idx >= 0 and len(row) > upload_status_idx:
-                                data['upload_status'].append(row[upload_status_idx].strip())
+                    if len(row) < min_row_len:
+                        continue
+                    if prepare_idx >= 0 and row[prepare_idx]:
+                        data['prepare'].append(row[prepare_idx].strip())
+                        if prepare_status_idx >= 0:
+                            data['prepare_status'].append(row[prepare_status_idx].strip())
+                    if validate_idx >= 0 and row[validate_idx]:
+                        data['validate'].append(row[validate_idx].strip())
+                        if validate_status_idx >= 0:
+                            data['validate_status'].append(row[validate_status_idx].strip())
+                    if sanitize_idx >= 0 and row[sanitize_idx]:
+                        data['sanitize'].append(row[sanitize_idx].strip())
+                        if sanitize_status_idx >= 0:
+                            data['sanitize_status'].append(row[sanitize_status_idx].strip())
+                    if upload_idx >= 0 and row[upload_idx]:
+                        data['upload'].append(row[upload_idx].strip())
+                        if upload_status_idx >= 0:
+                            data['upload_status'].append(row[upload_status_idx].strip())
 
             return data
 
@@ -232,8 +237,12 @@ class DataProc:
     def get_gdb_files_from_folder(gdb_folder):
         """Get all GDB files from the specified folder"""
         try:
-            import glob
-            gdb_files = glob.glob(os.path.join(gdb_folder, '*.gdb'))
+            if not os.path.isdir(gdb_folder):
+                return []
+
+            # Plain suffix test on the directory listing instead of glob's fnmatch
+            gdb_files = [os.path.join(gdb_folder, name) for name in os.listdir(gdb_folder)
+                         if name.endswith('.gdb') and not name.startswith('.')]
             return sorted(gdb_files)
         except Exception as e:
             print_error("Error getting GDB files: {}".format(e))
@@ -287,20 +296,20 @@ class DataProc:
             with open(output_file, 'w') as f:
                 if data and isinstance(data[0], dict):
                     fieldnames = data[0].keys()
-                    import csv
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
                     writer.writerows(data)
                 else:
                     writer = csv.writer(f)
                     writer.writerow(['survey_unit_id', 'status', 'message', 'timestamp'])
-                    for item in data:
-                        writer.writerow([
-                            item.get('survey_unit_id', ''),
-                            item.get('status', ''),
-                            item.get('message', ''),
-                            item.get('timestamp', datetime.now().isoformat())
-                        ])
+                    # Default timestamp computed once rather than per row
+                    now_iso = datetime.now().isoformat()
+                    writer.writerows((
+                        item.get('survey_unit_id', ''),
+                        item.get('status', ''),
+                        item.get('message', ''),
+                        item.get('timestamp', now_iso)
+                    ) for item in data)
 
             return True
 
@@ -345,11 +354,9 @@ class DataProc:
                 else:
                     col_index = 0
 
-                for row in reader:
-                    if len(row) > col_index:
-                        value = row[col_index].strip()
-                        if value:
-                            values.append(value)
+                values = [value for value in
+                          (row[col_index].strip() for row in reader if len(row) > col_index)
+                          if value]
 
             return values
 
@@ -375,11 +382,13 @@ class DataProc:
 
     @staticmethod
     def chunk_data(data, chunk_size=500):
-        """Split data into chunks for processing"""
-        chunks = []
-        for i in range(0, len(data), chunk_size):
-            chunks.append(data[i:i + chunk_size])
-        return chunks
+        """Yield data in chunks for processing, one chunk at a time (currently unused)"""
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            yield chunk
 
     @staticmethod
     def get_unique_wards(hierarchical_data):
@@ -411,18 +420,31 @@ class DataProc:
         print("\n=== Hierarchical Data Summary ===")
         print("Total hierarchical entries: {}".format(len(hierarchical_data)))
 
-        states = len(set(data['State'] for data in hierarchical_data if data['State']))
-        districts = len(set(data['District'] for data in hierarchical_data if data['District']))
-        ulbs = len(set(data['Ulb'] for data in hierarchical_data if data['Ulb']))
-        wards = len(set(data['Ward'] for data in hierarchical_data if data['Ward']))
-        total_survey_units = len([data for data in hierarchical_data if data['SurveyUnit']])
-        unique_survey_unit_names = len(set(data['SurveyUnit'] for data in hierarchical_data if data['SurveyUnit']))
-
-        print("States: {}".format(states))
-        print("Districts: {}".format(districts))
-        print("ULBs: {}".format(ulbs))
-        print("Wards: {}".format(wards))
-        print("Survey Units: {} ({} unique names)".format(total_survey_units, unique_survey_unit_names))
+        # Single pass over the data collecting all distinct values at once
+        states = set()
+        districts = set()
+        ulbs = set()
+        wards = set()
+        survey_unit_names = set()
+        total_survey_units = 0
+        for data in hierarchical_data:
+            if data['State']:
+                states.add(data['State'])
+            if data['District']:
+                districts.add(data['District'])
+            if data['Ulb']:
+                ulbs.add(data['Ulb'])
+            if data['Ward']:
+                wards.add(data['Ward'])
+            if data['SurveyUnit']:
+                total_survey_units += 1
+                survey_unit_names.add(data['SurveyUnit'])
+
+        print("States: {}".format(len(states)))
+        print("Districts: {}".format(len(districts)))
+        print("ULBs: {}".format(len(ulbs)))
+        print("Wards: {}".format(len(wards)))
+        print("Survey Units: {} ({} unique names)".format(total_survey_units, len(survey_unit_names)))
 
 
 # Simple survey unit matching functions (from surmatch.py)
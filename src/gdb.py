@@ -2447,7 +2447,7 @@ class GDBValid:
 
             # Phase 1: ArcPy SelectLayerByLocation method (most comprehensive)
             print("    Using ArcPy SelectLayerByLocation for comprehensive intersection detection...")
-            arcpy_intersect_pairs = []
+            arcpy_intersect_pairs = set()
 
             try:
                 # Create a temporary feature layer for spatial queries
@@ -2466,10 +2466,8 @@ class GDBValid:
                         intersecting_oids = [row[0] for row in cursor if row[0] != oid]
 
                         for intersect_oid in intersecting_oids:
-                            # Ensure consistent ordering and avoid duplicates
-                            pair = tuple(sorted([oid, intersect_oid]))
-                            if pair not in arcpy_intersect_pairs:
-                                arcpy_intersect_pairs.append(pair)
+                            # Ensure consistent ordering - the set drops duplicates
+                            arcpy_intersect_pairs.add(tuple(sorted([oid, intersect_oid])))
 
                 # Clean up the temporary layer
                 arcpy.Delete_management("temp_overlap_layer")
@@ -2478,7 +2476,7 @@ class GDBValid:
 
             except Exception as arcpy_error:
                 result['warnings'].append("ArcPy SelectLayerByLocation method failed: {}".format(str(arcpy_error)))
-                arcpy_intersect_pairs = []
+                arcpy_intersect_pairs = set()
 
             # Phase 2: Enhanced pairwise validation using multiple geometry methods
             print("    Performing detailed geometry analysis for all {} pairs...".format(len(geometries) * (len(geometries) - 1) // 2))
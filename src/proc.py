@@ -397,7 +397,7 @@ class DataWorkflows:
             return False
 
     @staticmethod
-    def process_sanitize_column(gdb_folder, count=None, buffer_erase_cm=None, do_overlap_fix=None, remove_slivers=False):
+    def process_sanitize_column(gdb_folder, count=None, buffer_erase_cm=None, do_overlap_fix=None, remove_slivers=False, workers=None):
         """Process sanitize all GDB files in folder"""
         try:
             print("=== PROCESS SANITIZE COLUMN ===")
@@ -424,7 +424,47 @@ class DataWorkflows:
             success_count = 0
             already_processed_count = 0
 
-            for i, survey_unit in enumerate(sanitize_list, 1):
+            # Sanitize survey units in parallel worker processes when requested; a single
+            # survey unit uses the workers for its overlapping pairs instead
+            sequential_list = sanitize_list
+            if workers and workers > 1 and len(sanitize_list) > 1:
+                try:
+                    import arcpy
+                except ImportError:
+                    print("ERROR: ArcPy not available for sanitization")
+                    return False
+
+                from src.sani import PolygonSanitizer
+
+                fc_paths = []
+                for survey_unit in sanitize_list:
+                    gdb_path = os.path.join(gdb_folder, survey_unit + '.gdb')
+                    if not os.path.exists(gdb_path):
+                        print("SKIPPED: GDB file not found for {}".format(survey_unit))
+                        continue
+                    fc_path = os.path.join(gdb_path, "PROPERTY_PARCEL")
+                    if not arcpy.Exists(fc_path):
+                        print("SKIPPED: PROPERTY_PARCEL not found in {}".format(survey_unit))
+                        continue
+                    fc_paths.append(fc_path)
+
+                print("Sanitizing {} PROPERTY_PARCEL feature classes with {} workers...".format(len(fc_paths), workers))
+                results = PolygonSanitizer.sanitize_all(fc_paths, workers, buffer_erase_cm=buffer_erase_cm,
+                                                        do_overlap_fix=do_overlap_fix, remove_slivers=remove_slivers)
+
+                for fc_path, success, message, feature_count in results:
+                    survey_unit = DataProc.extract_survey_unit_from_gdb_path(os.path.dirname(fc_path))
+                    if success:
+                        success_count += 1
+                        print("CLEAN: {}".format(survey_unit))
+                        print("    {}".format(message))
+                    else:
+                        print("FAILED: {}".format(survey_unit))
+                        print("    ERROR: {}".format(message))
+
+                sequential_list = []
+
+            for i, survey_unit in enumerate(sequential_list, 1):
                 print("\nSanitizing {}/{}: {}".format(i, len(sanitize_list), survey_unit))
 
                 # Check GDB file exists
@@ -454,7 +494,7 @@ class DataWorkflows:
                         continue
 
                     print("    Sanitizing PROPERTY_PARCEL feature class...")
-                    success, message, feature_count = sanitizer.sanitize_feature_class(fc_path, buffer_erase_cm=buffer_erase_cm, do_overlap_fix=do_overlap_fix, remove_slivers=remove_slivers)
+                    success, message, feature_count = sanitizer.sanitize_feature_class(fc_path, buffer_erase_cm=buffer_erase_cm, do_overlap_fix=do_overlap_fix, remove_slivers=remove_slivers, pair_workers=workers)
 
                     if success:
                         success_count += 1
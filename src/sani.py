@@ -6,10 +6,29 @@ Data processing for CSV parsing and hierarchical data management
 """
 
 import csv
+import json
 import os
 import random
 import math
+import sys
 from datetime import datetime
+from itertools import islice
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+# Workflow column headers in data.csv, each optionally followed by a status column
+DATA_COLUMNS = frozenset(('prepare', 'validate', 'sanitize', 'upload'))
+
+# Iterative buffer-erase distances: 1cm to 80cm in 1cm steps
+_BUFFER_DISTANCES_CM = tuple("{} Meters".format(cm / 100.0) for cm in range(1, 81))
+
+# Exponential probe order (cm) used before bisecting to the smallest resolving distance
+_BUFFER_PROBES_CM = (1, 2, 4, 8, 16, 32, 64, 80)
+
+# Erasers with more vertices than this are subdivided before Erase, where SubdividePolygon exists
+_SUBDIVIDE_POINT_COUNT = 10000
 
 # Simple console functions
 def print_error(msg):
@@ -115,48 +134,49 @@ class DataProc:
                 reader = csv.reader(f)
                 headers = next(reader)
 
-                prepare_idx = validate_idx = sanitize_idx = upload_idx = -1
-                prepare_status_idx = validate_status_idx = sanitize_status_idx = upload_status_idx = -1
+                column_idx = {}
                 for i, header in enumerate(headers):
                     header_lower = header.lower()
-                    if header_lower == 'prepare':
-                        prepare_idx = i
-                    elif header_lower == 'validate':
-                        validate_idx = i
-                    elif header_lower == 'sanitize':
-                        sanitize_idx = i
-                    elif header_lower == 'upload':
-                        upload_idx = i
+                    if header_lower in DATA_COLUMNS:
+                        column_idx[header_lower] = i
                     elif header_lower == 'status' and i > 0:
                         # Determine which status column this is based on previous column
-                        if i == prepare_idx + 1:
-                            prepare_status_idx = i
-                        elif i == validate_idx + 1:
-                            validate_status_idx = i
-                        elif i == sanitize_idx + 1:
-                            sanitize_status_idx = i
-                        elif i == upload_idx + 1:
-                            upload_status_idx = i
+                        previous_lower = headers[i - 1].lower()
+                        if previous_lower in DATA_COLUMNS:
+                            column_idx[previous_lower + '_status'] = i
+
+                prepare_idx = column_idx.get('prepare', -1)
+                validate_idx = column_idx.get('validate', -1)
+                sanitize_idx = column_idx.get('sanitize', -1)
+                upload_idx = column_idx.get('upload', -1)
+                prepare_status_idx = column_idx.get('prepare_status', -1)
+                validate_status_idx = column_idx.get('validate_status', -1)
+                sanitize_status_idx = column_idx.get('sanitize_status', -1)
+                upload_status_idx = column_idx.get('upload_status', -1)
+
+                # Rows shorter than the right-most known column are skipped
+                min_row_len = max(prepare_idx, validate_idx, sanitize_idx, upload_idx,
+                                  prepare_status_idx, validate_status_idx, sanitize_status_idx, upload_status_idx) + 1
 
                 for row in reader:
-                    if len(row) > max(prepare_idx, validate_idx, sanitize_idx, upload_idx,
-                                  prepare_status_idx, validate_status_idx, sanitize_status_idx, upload_status_idx):
-                        if prepare_idx >= 0 and row[prepare_idx]:
-                            data['prepare'].append(row[prepare_idx].strip())
-                            if prepare_status_idx >= 0 and len(row) > prepare_status_idx:
-                                data['prepare_status'].append(row[prepare_status_idx].strip())
-                        if validate_idx >= 0 and row[validate_idx]:
-                            data['validate'].append(row[validate_idx].strip())
-                            if validate_status_idx >= 0 and len(row) > validate_status_idx:
-                                data['validate_status'].append(row[validate_status_idx].strip())
-                        if sanitize_idx >= 0 and row[sanitize_idx]:
-                            data['sanitize'].append(row[sanitize_idx].strip())
-                            if sanitize_status_idx >= 0 and len(row) > sanitize_status_idx:
-                                data['sanitize_status'].append(row[sanitize_status_idx].strip())
-                        if upload_idx >= 0 and row[upload_idx]:
-                            data['upload'].append(row[upload_idx].strip())
-                            if upload_status_idx >= 0 and len(row) > upload_status_idx:
-                                data['upload_status'].append(row[upload_status_idx].strip())
+                    if len(row) < min_row_len:
+                        continue
+                    if prepare_idx >= 0 and row[prepare_idx]:
+                        data['prepare'].append(row[prepare_idx].strip())
+                        if prepare_status_idx >= 0:
+                            data['prepare_status'].append(row[prepare_status_idx].strip())
+                    if validate_idx >= 0 and row[validate_idx]:
+                        data['validate'].append(row[validate_idx].strip())
+                        if validate_status_idx >= 0:
+                            data['validate_status'].append(row[validate_status_idx].strip())
+                    if sanitize_idx >= 0 and row[sanitize_idx]:
+                        data['sanitize'].append(row[sanitize_idx].strip())
+                        if sanitize_status_idx >= 0:
+                            data['sanitize_status'].append(row[sanitize_status_idx].strip())
+                    if upload_idx >= 0 and row[upload_idx]:
+                        data['upload'].append(row[upload_idx].strip())
+                        if upload_status_idx >= 0:
+                            data['upload_status'].append(row[upload_status_idx].strip())
 
             return data
 
@@ -234,8 +254,12 @@ class DataProc:
     def get_gdb_files_from_folder(gdb_folder):
         """Get all GDB files from the specified folder"""
         try:
-            import glob
-            gdb_files = glob.glob(os.path.join(gdb_folder, '*.gdb'))
+            if not os.path.isdir(gdb_folder):
+                return []
+
+            # Plain suffix test on the directory listing instead of glob's fnmatch
+            gdb_files = [os.path.join(gdb_folder, name) for name in os.listdir(gdb_folder)
+                         if name.endswith('.gdb') and not name.startswith('.')]
             return sorted(gdb_files)
         except Exception as e:
             print_error("Error getting GDB files: {}".format(e))
@@ -289,20 +313,20 @@ class DataProc:
             with open(output_file, 'w') as f:
                 if data and isinstance(data[0], dict):
                     fieldnames = data[0].keys()
-                    import csv
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
                     writer.writerows(data)
                 else:
                     writer = csv.writer(f)
                     writer.writerow(['survey_unit_id', 'status', 'message', 'timestamp'])
-                    for item in data:
-                        writer.writerow([
-                            item.get('survey_unit_id', ''),
-                            item.get('status', ''),
-                            item.get('message', ''),
-                            item.get('timestamp', datetime.now().isoformat())
-                        ])
+                    # Default timestamp computed once rather than per row
+                    now_iso = datetime.now().isoformat()
+                    writer.writerows((
+                        item.get('survey_unit_id', ''),
+                        item.get('status', ''),
+                        item.get('message', ''),
+                        item.get('timestamp', now_iso)
+                    ) for item in data)
 
             return True
 
@@ -347,11 +371,9 @@ class DataProc:
                 else:
                     col_index = 0
 
-                for row in reader:
-                    if len(row) > col_index:
-                        value = row[col_index].strip()
-                        if value:
-                            values.append(value)
+                values = [value for value in
+                          (row[col_index].strip() for row in reader if len(row) > col_index)
+                          if value]
 
             return values
 
@@ -377,11 +399,13 @@ class DataProc:
 
     @staticmethod
     def chunk_data(data, chunk_size=500):
-        """Split data into chunks for processing"""
-        chunks = []
-        for i in range(0, len(data), chunk_size):
-            chunks.append(data[i:i + chunk_size])
-        return chunks
+        """Yield data in chunks for processing, one chunk at a time (currently unused)"""
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            yield chunk
 
     @staticmethod
     def get_unique_wards(hierarchical_data):
@@ -413,18 +437,31 @@ class DataProc:
         print("\n=== Hierarchical Data Summary ===")
         print("Total hierarchical entries: {}".format(len(hierarchical_data)))
 
-        states = len(set(data['State'] for data in hierarchical_data if data['State']))
-        districts = len(set(data['District'] for data in hierarchical_data if data['District']))
-        ulbs = len(set(data['Ulb'] for data in hierarchical_data if data['Ulb']))
-        wards = len(set(data['Ward'] for data in hierarchical_data if data['Ward']))
-        total_survey_units = len([data for data in hierarchical_data if data['SurveyUnit']])
-        unique_survey_unit_names = len(set(data['SurveyUnit'] for data in hierarchical_data if data['SurveyUnit']))
-
-        print("States: {}".format(states))
-        print("Districts: {}".format(districts))
-        print("ULBs: {}".format(ulbs))
-        print("Wards: {}".format(wards))
-        print("Survey Units: {} ({} unique names)".format(total_survey_units, unique_survey_unit_names))
+        # Single pass over the data collecting all distinct values at once
+        states = set()
+        districts = set()
+        ulbs = set()
+        wards = set()
+        survey_unit_names = set()
+        total_survey_units = 0
+        for data in hierarchical_data:
+            if data['State']:
+                states.add(data['State'])
+            if data['District']:
+                districts.add(data['District'])
+            if data['Ulb']:
+                ulbs.add(data['Ulb'])
+            if data['Ward']:
+                wards.add(data['Ward'])
+            if data['SurveyUnit']:
+                total_survey_units += 1
+                survey_unit_names.add(data['SurveyUnit'])
+
+        print("States: {}".format(len(states)))
+        print("Districts: {}".format(len(districts)))
+        print("ULBs: {}".format(len(ulbs)))
+        print("Wards: {}".format(len(wards)))
+        print("Survey Units: {} ({} unique names)".format(total_survey_units, len(survey_unit_names)))
 
 
 # Simple survey unit matching functions (from surmatch.py)
@@ -491,9 +528,14 @@ class PolygonSanitizer:
             if not geom or geom.type != "polygon":
                 return False
 
+            # A single part can never be a true multipart - skip the point scan
+            part_count = geom.partCount
+            if part_count <= 1:
+                return False
+
             # Count actual parts using getPart method
             actual_part_count = 0
-            for part_index in range(geom.partCount):
+            for part_index in range(part_count):
                 part = geom.getPart(part_index)
                 if part:
                     # Check if this part has actual geometry points
@@ -514,7 +556,48 @@ class PolygonSanitizer:
             except:
                 return False
 
-    def sanitize_feature_class(self, input_fc, cluster_tolerance=0.001, verbose=False, buffer_erase_cm=None, do_overlap_fix=None, remove_slivers=False):
+    @staticmethod
+    def sanitize_all(fc_paths, workers=None, **options):
+        """
+        Sanitize several feature classes in parallel, one worker process per feature class
+
+        Args:
+            fc_paths (list): Feature class paths, each in its own GDB
+            workers (int): Number of worker processes (default: CPU count)
+            **options: Keyword arguments passed to sanitize_feature_class
+
+        Each worker's console output is captured and printed here, one feature class at
+        a time, so it reaches the parent's log instead of interleaving on the console.
+
+        Returns:
+            list: (fc_path, success, message, feature_count) tuples in input order
+        """
+        import multiprocessing
+
+        tasks = [(fc_path, options) for fc_path in fc_paths]
+        workers = min(workers or multiprocessing.cpu_count(), len(tasks))
+
+        results = []
+        if workers <= 1:
+            for task in tasks:
+                fc_path, success, message, feature_count, output = _sanitize_worker(task)
+                sys.stdout.write(output)
+                results.append((fc_path, success, message, feature_count))
+            return results
+
+        # ArcPy is not fork-safe; on Windows every worker is spawned and imports arcpy itself
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            # imap yields in input order as soon as each feature class is done
+            for fc_path, success, message, feature_count, output in pool.imap(_sanitize_worker, tasks, chunksize=1):
+                sys.stdout.write(output)
+                results.append((fc_path, success, message, feature_count))
+            return results
+        finally:
+            pool.close()
+            pool.join()
+
+    def sanitize_feature_class(self, input_fc, cluster_tolerance=0.001, verbose=False, buffer_erase_cm=None, do_overlap_fix=None, remove_slivers=False, pair_workers=None):
         """
         Sanitize a feature class using simplified approach based on working reference
 
@@ -522,12 +605,12 @@ class PolygonSanitizer:
             input_fc (str): Path to input feature class
             cluster_tolerance (float): Tolerance for topology operations
             verbose (bool): Enable verbose output
+            pair_workers (int): Worker processes for resolving overlapping pairs (default: sequential)
 
         Returns:
             tuple: (success, message, feature_count)
         """
         try:
-            import arcpy
 
             if not arcpy.Exists(input_fc):
                 return False, "Feature class does not exist: {}".format(input_fc), 0
@@ -557,7 +640,7 @@ class PolygonSanitizer:
             # Step 2: Fix overlapping pairs using iterative buffer-erase (before multipart conversion)
             if do_overlap_fix:
                 print_info("Step 2: Fixing overlapping pairs...")
-                overlap_pairs_resolved = self._fix_overlapping_pairs_iterative(input_fc, verbose, buffer_erase_cm)
+                overlap_pairs_resolved = self._fix_overlapping_pairs_iterative(input_fc, verbose, buffer_erase_cm, pair_workers)
                 print_info("    Resolved {} overlapping pairs".format(overlap_pairs_resolved))
             else:
                 print_info("Step 2: Skipping overlapping pairs fixing (use --do-overlap-fix to enable)...")
@@ -568,19 +651,12 @@ class PolygonSanitizer:
             multipart_count = self._convert_multipart_simple(input_fc, verbose)
             print_info("    Converted {} multipart features".format(multipart_count))
 
-            # Step 4: Remove contained features using geometry operations
-            print_info("Step 4: Removing contained features...")
-            contained_removed = self._remove_contained_simple(input_fc, verbose)
+            # Steps 4-6: Remove contained features, repair holes and simplify complex geometries
+            # using one read pass and one write pass over the feature class
+            print_info("Steps 4-6: Removing contained features, repairing holes, simplifying complex geometries...")
+            contained_removed, holes_removed, simplified_count = self._combined_geometry_pass(input_fc, verbose)
             print_info("    Removed {} contained features".format(contained_removed))
-
-            # Step 5: Remove polygons with holes (first)
-            print_info("Step 5: Removing polygons with holes...")
-            holes_removed = self._remove_polygons_with_holes(input_fc, verbose)
             print_info("    Removed {} polygons with holes".format(holes_removed))
-
-            # Step 6: Simplify complex geometries
-            print_info("Step 6: Simplifying complex geometries...")
-            simplified_count = self._simplify_complex_geometries(input_fc, verbose)
             print_info("    Simplified {} complex geometries".format(simplified_count))
 
             # Step 7: Fix geometries using ArcPy tools
@@ -627,170 +703,84 @@ class PolygonSanitizer:
         except Exception as e:
             return False, "Sanitization failed: {}".format(e), 0
 
-    def _remove_duplicates_simple(self, input_fc, verbose=False):
-        """Remove duplicates using simple spatial analysis like reference"""
-        try:
-            import arcpy
-
-            duplicates_removed = 0
-
-            # Create temporary feature class for processing
-            temp_fc = "temp_duplicate_removal"
-            if arcpy.Exists(temp_fc):
-                arcpy.Delete_management(temp_fc)
-
-            # Use spatial analysis to find and remove duplicates
-            arcpy.Select_analysis(input_fc, temp_fc)
-
-            if arcpy.Exists(temp_fc):
-                # Simple duplicate removal based on geometry extent and centroid
-                with arcpy.da.UpdateCursor(temp_fc, ["OID@", "SHAPE@"]) as cursor:
-                    processed_geometries = set()
-                    duplicate_oids = []
-
-                    for oid, geom in cursor:
-                        if geom:
-                            # Create simple signature based on centroid and extent
-                            try:
-                                centroid = geom.centroid
-                                extent = geom.extent
-                                signature = "{:.3f}_{:.3f}_{:.3f}_{:.3f}".format(
-                                    centroid.X, centroid.Y, extent.width, extent.height
-                                )
-
-                                if signature in processed_geometries:
-                                    duplicate_oids.append(oid)
-                                else:
-                                    processed_geometries.add(signature)
-                            except:
-                                continue
-
-                    # Delete duplicates
-                    for oid in duplicate_oids:
-                        try:
-                            cursor.deleteRow()
-                            duplicates_removed += 1
-                        except:
-                            continue
-
-                # Clean up
-                arcpy.Delete_management(temp_fc)
-
-            return duplicates_removed
-
-        except Exception as e:
-            if verbose:
-                print_info("    Duplicate removal failed: {}".format(e))
-            return 0
-
     def _convert_multipart_simple(self, input_fc, verbose=False):
         """Convert multipart to singlepart using manual geometry processing"""
         try:
-            import arcpy
 
-            # Check for multipart features
-            multipart_count = 0
+            # Read the field list once; OID@ and SHAPE@ always sit at index 0 and 1
+            field_names = tuple(f.name for f in arcpy.ListFields(input_fc)
+                                if f.editable and f.type not in ("OID", "Geometry"))
+            all_fields = ("OID@", "SHAPE@") + field_names
+            oid_idx = 0
+            geom_idx = 1
+
+            # Partition features in a single pass - singlepart features are left untouched
             multipart_features = []
 
-            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"] + [f.name for f in arcpy.ListFields(input_fc) if f.name not in ["OID@", "SHAPE@"]]) as cursor:
+            with arcpy.da.SearchCursor(input_fc, all_fields) as cursor:
                 for row in cursor:
-                    oid = row[0]
-                    geom = row[1]
+                    geom = row[geom_idx]
                     if geom and self._is_truly_multipart(geom):
-                        multipart_count += 1
                         multipart_features.append(row)
 
+            multipart_count = len(multipart_features)
             if multipart_count == 0:
                 return 0
 
             if verbose:
                 print_info("    Found {} multipart features, converting manually...".format(multipart_count))
 
-            # Get all field names for proper copying
-            all_fields = [f.name for f in arcpy.ListFields(input_fc)]
-
-            # Collect all singlepart features (including existing singlepart features)
-            all_singlepart_features = []
-
-            # First, collect existing singlepart features
-            with arcpy.da.SearchCursor(input_fc, all_fields) as cursor:
-                for row in cursor:
-                    oid_idx = all_fields.index("OID@") if "OID@" in all_fields else 0
-                    geom_idx = all_fields.index("SHAPE@") if "SHAPE@" in all_fields else 1
-
-                    oid = row[oid_idx]
-                    geom = row[geom_idx]
-
-                    if not geom or not self._is_truly_multipart(geom):
-                        # Already singlepart, keep as-is
-                        all_singlepart_features.append(row)
-
-            # Then, convert multipart features to singlepart
+            # Then, convert multipart features to singlepart. Parts are inserted as soon as
+            # they are built, so only one feature's parts are held in memory at a time.
             converted_count = 0
-            for multipart_row in multipart_features:
-                oid_idx = all_fields.index("OID@") if "OID@" in all_fields else 0
-                geom_idx = all_fields.index("SHAPE@") if "SHAPE@" in all_fields else 1
+            exploded_oids = []
+            inserted_count = 0
+            with arcpy.da.InsertCursor(input_fc, all_fields[1:]) as insert_cursor:
+                for multipart_row in multipart_features:
+                    oid = multipart_row[oid_idx]
+                    geom = multipart_row[geom_idx]
 
-                oid = multipart_row[oid_idx]
-                geom = multipart_row[geom_idx]
-
-                if verbose:
-                    print_info("    Converting OBJECTID {} with {} parts...".format(oid, geom.partCount if geom else 0))
+                    if verbose:
+                        print_info("    Converting OBJECTID {} with {} parts...".format(oid, geom.partCount if geom else 0))
 
-                # Convert multipart to singlepart geometries
-                if geom and (geom.partCount > 1 or self._is_truly_multipart(geom)):
-                    # Handle both true multipart (partCount > 1) and complex single-part geometries (isMultipart=True, partCount=1)
-                    if geom.partCount > 1:
-                        # True multipart geometry - split into multiple singlepart features
+                    # True multipart geometry - split into multiple singlepart features
+                    if geom and geom.partCount > 1:
+                        part_rows = []
                         for part_index in range(geom.partCount):
                             try:
                                 # Extract individual part as singlepart geometry
-                                part_geom = geom.getPart(part_index)
+                                part_geom = arcpy.Polygon(geom.getPart(part_index), geom.spatialReference)
 
-                                if part_geom and hasattr(part_geom, 'area'):
-                                    # Create new row for this singlepart
-                                    new_row = list(multipart_row)
-                                    new_row[geom_idx] = part_geom
-                                    all_singlepart_features.append(tuple(new_row))
-                                    converted_count += 1
+                                if part_geom and not part_geom.isEmpty:
+                                    # Create new row for this singlepart (OID is assigned on insert)
+                                    new_row = list(multipart_row[1:])
+                                    new_row[geom_idx - 1] = part_geom
+                                    part_rows.append(tuple(new_row))
 
                             except Exception as part_error:
                                 if verbose:
                                     print_info("    Warning: Could not extract part {} from OBJECTID {}: {}".format(part_index, oid, part_error))
                                 continue
-                    else:
-                        # Complex single-part geometry - recreate as clean singlepart geometry
-                        try:
-                            # For complex single-part, recreate the geometry to ensure it's properly formed
-                            recreated_geom = geom
-                            if hasattr(recreated_geom, 'area'):
-                                # Create new row with recreated geometry
-                                new_row = list(multipart_row)
-                                new_row[geom_idx] = recreated_geom
-                                all_singlepart_features.append(tuple(new_row))
-                                converted_count += 1
-                            elif verbose:
-                                print_info("    Warning: Could not recreate geometry for OBJECTID {}".format(oid))
-
-                        except Exception as recreate_error:
-                            if verbose:
-                                print_info("    Warning: Could not recreate OBJECTID {}: {}".format(oid, recreate_error))
-                            # Keep original if recreation fails
-                            all_singlepart_features.append(multipart_row)
+
+                        # Only replace the original when at least one part was extracted
+                        if part_rows:
+                            for part_row in part_rows:
+                                insert_cursor.insertRow(part_row)
+                            inserted_count += len(part_rows)
+                            exploded_oids.append(oid)
+                            converted_count += len(part_rows)
 
             if verbose:
                 print_info("    Converted {} multipart features into {} singlepart features".format(multipart_count, converted_count))
 
-            # Delete all features and reinsert all singlepart features
-            arcpy.management.DeleteFeatures(input_fc)
-
-            # Insert all singlepart features
-            with arcpy.da.InsertCursor(input_fc, all_fields) as cursor:
-                for feature_row in all_singlepart_features:
-                    cursor.insertRow(feature_row)
+            # Their parts are already inserted, delete the exploded originals
+            for where_clause in self._oid_where_clauses(exploded_oids):
+                with arcpy.da.UpdateCursor(input_fc, ["OID@"], where_clause) as cursor:
+                    for row in cursor:
+                        cursor.deleteRow()
 
             if verbose:
-                print_info("    Successfully inserted {} total singlepart features".format(len(all_singlepart_features)))
+                print_info("    Successfully inserted {} singlepart features".format(inserted_count))
 
             return multipart_count
 
@@ -801,231 +791,150 @@ class PolygonSanitizer:
                 traceback.print_exc()
             return 0
 
-    def _remove_contained_simple(self, input_fc, verbose=False):
-        """Remove contained features using simple geometry operations"""
-        try:
-            import arcpy
-
-            contained_removed = 0
+    def _combined_geometry_pass(self, input_fc, verbose=False):
+        """
+        Remove contained features, repair polygons with holes and simplify complex
+        geometries using one read pass and one write pass over the feature class
 
-            # Create temporary layer for processing
-            layer_name = "temp_containment_layer"
-            if arcpy.Exists(layer_name):
-                arcpy.management.Delete(layer_name)
+        Args:
+            input_fc (str): Path to input feature class
+            verbose (bool): Enable verbose output
 
-            arcpy.management.MakeFeatureLayer(input_fc, layer_name)
+        Returns:
+            tuple: (contained_removed, holes_removed, simplified_count)
+        """
+        try:
 
-            # Find and remove contained features
-            with arcpy.da.SearchCursor(layer_name, ["OID@", "SHAPE@"]) as cursor:
+            # Read all geometries once - containment needs them all in memory anyway
+            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"]) as cursor:
                 features = list(cursor)
 
-                for i, (oid1, geom1) in enumerate(features):
-                    if not geom1:
-                        continue
-
-                    for j, (oid2, geom2) in enumerate(features):
-                        if i >= j:  # Don't compare with self
-                            continue
-
-                        if not geom2:
-                            continue
-
-                        # Check containment
-                        remove_oid = None
-                        if geom1.contains(geom2):
-                            remove_oid = oid2
-                        elif geom2.contains(geom1):
-                            remove_oid = oid1
-
-                        if remove_oid:
-                            try:
-                                arcpy.management.SelectLayerByAttribute(layer_name, "NEW_SELECTION",
-                                                                      "OBJECTID = {}".format(remove_oid))
-                                selected_count = int(arcpy.GetCount_management(layer_name).getOutput(0))
-                                if selected_count > 0:
-                                    arcpy.management.DeleteFeatures(layer_name)
-                                    contained_removed += 1
-                            except:
-                                continue
-
-            # Clean up
-            if arcpy.Exists(layer_name):
-                arcpy.management.Delete(layer_name)
+            contained_oids = self._find_contained_oids(features)
 
-            return contained_removed
-
-        except Exception as e:
-            if verbose:
-                print_info("    Containment removal failed: {}".format(e))
-            return 0
+            # Decide hole repairs and complexity on the features that survive containment
+            repairs = {}
+            complex_count = 0
+            total_vertices = 0
 
-    def _simplify_complex_geometries(self, input_fc, verbose=False):
-        """Simplify complex geometries using direct in-place Generalize tool"""
-        try:
-            import arcpy
+            for oid, geom in features:
+                if oid in contained_oids or not geom or geom.type != "polygon":
+                    continue
 
-            if verbose:
-                print_info("    Identifying complex geometries for simplification...")
-
-            # Get all field names for processing
-            all_fields = [f.name for f in arcpy.ListFields(input_fc)]
+                has_holes = self._has_holes(geom)
+                if has_holes:
+                    try:
+                        repaired_geom = self._extract_exterior_rings(geom, verbose)
+                        if repaired_geom and not repaired_geom.isEmpty:
+                            repairs[oid] = repaired_geom
+                            geom = repaired_geom
+                        elif verbose and len(repairs) < 5:
+                            print_info("      Could not repair OBJECTID {} - empty exterior ring".format(oid))
+                    except Exception as repair_error:
+                        if verbose and len(repairs) < 5:
+                            print_info("      Could not repair OBJECTID {}: {}".format(oid, repair_error))
+
+                # Cheap vertex count first. _has_holes returning False already ruled out a
+                # true multipart, and a repaired geometry is a single ring, so the multipart
+                # scan only runs for holed features that could not be repaired
+                point_count = geom.pointCount
+                if point_count > 100 or (has_holes and oid not in repairs and self._is_truly_multipart(geom)):
+                    complex_count += 1
+                    # Vertex totals are only reported, so only gathered in verbose mode
+                    if verbose:
+                        total_vertices += point_count
 
-            # Count complex geometries (multipart or high vertex count)
-            complex_count = 0
-            total_vertices = 0
+            # Apply deletions and hole repairs in one write pass limited to the touched
+            # features, in OBJECTID IN (...) batches
+            contained_removed = 0
+            holes_removed = 0
 
-            complex_features = []
-            with arcpy.da.SearchCursor(input_fc, all_fields) as cursor:
-                for row in cursor:
-                    oid_idx = all_fields.index("OID@")
-                    geom_idx = all_fields.index("SHAPE@")
+            for where_clause in self._oid_where_clauses(contained_oids | set(repairs)):
+                with arcpy.da.UpdateCursor(input_fc, ["OID@", "SHAPE@"], where_clause) as cursor:
+                    for oid, geom in cursor:
+                        if oid in contained_oids:
+                            cursor.deleteRow()
+                            contained_removed += 1
+                        else:
+                            cursor.updateRow([oid, repairs[oid]])
+                            holes_removed += 1
 
-                    oid = row[oid_idx]
-                    geom = row[geom_idx]
+                            if verbose and holes_removed <= 5:
+                                print_info("      Repaired OBJECTID {} (removed interior rings)".format(oid))
 
-                    if geom and geom.type == "polygon":
-                        # Consider complex if multipart or >100 vertices
-                        if self._is_truly_multipart(geom) or geom.pointCount > 100:
-                            complex_count += 1
-                            total_vertices += geom.pointCount
-                            complex_features.append(row)
+            # Generalize is a whole feature class tool - run it once, only when needed
+            simplified_count = 0
 
             if complex_count == 0:
                 if verbose:
                     print_info("    No complex geometries found for simplification")
-                return 0
-
-            if verbose:
-                print_info("    Found {} complex geometries with {} total vertices".format(
-                    complex_count, total_vertices))
-
-            # Use ArcPy's Generalize tool directly on the feature class
-            # This is safer and preserves all features
-            try:
+            else:
                 if verbose:
+                    print_info("    Found {} complex geometries with {} total vertices".format(
+                        complex_count, total_vertices))
                     print_info("    Applying Generalize with 0.1 meter tolerance...")
+                try:
+                    arcpy.edit.Generalize(input_fc, "0.1 Meters")
+                    simplified_count = complex_count
+                except Exception as generalize_error:
+                    if verbose:
+                        print_info("    Generalization failed: {}".format(generalize_error))
 
-                # Get count before generalization
-                original_count = int(arcpy.management.GetCount(input_fc)[0])
-
-                # Apply Generalize to simplify complex geometries
-                arcpy.edit.Generalize(input_fc, "0.1 Meters")
-
-                # Get count after generalization
-                simplified_count = int(arcpy.management.GetCount(input_fc)[0])
-
-                # Count reduced vertices
-                vertices_reduced = 0
-                current_vertices = 0
-                complex_after = 0
-
-                with arcpy.da.SearchCursor(input_fc, ["SHAPE@"]) as cursor:
-                    for geom, in cursor:
-                        if geom and geom.type == "polygon":
-                            current_vertices += geom.pointCount
-                            if self._is_truly_multipart(geom) or geom.pointCount > 100:
-                                complex_after += 1
-
-                vertices_reduced = total_vertices - current_vertices
-
-                if verbose:
-                    print_info("    Generalization completed:")
-                    print_info("      Features preserved: {} -> {}".format(original_count, simplified_count))
-                    print_info("      Complex geometries: {} -> {}".format(complex_count, complex_after))
-                    print_info("      Vertex reduction: {} -> {} (saved {} vertices)".format(
-                        total_vertices, current_vertices, vertices_reduced))
-
-                    if vertices_reduced > 0:
-                        print_info("      Average vertex reduction: {:.1f} vertices per feature".format(
-                            vertices_reduced / complex_count if complex_count > 0 else 0))
-
-                return complex_count
-
-            except Exception as generalize_error:
-                if verbose:
-                    print_warning("    Generalization failed: {}".format(generalize_error))
-                return 0
+            return contained_removed, holes_removed, simplified_count
 
         except Exception as e:
             if verbose:
-                print_warning("    Error simplifying complex geometries: {}".format(e))
-                import traceback
-                traceback.print_exc()
-            return 0
-
-    def _remove_polygons_with_holes(self, input_fc, verbose=False):
-        """Repair polygons with holes by extracting exterior rings (removing interior rings)"""
-        try:
-            import arcpy
-
-            if verbose:
-                print_info("    Repairing polygons with holes...")
-
-            # Repair polygons with holes by extracting exterior rings
-            repaired_count = 0
-            field_names = [f.name for f in arcpy.ListFields(input_fc) if f.name not in ["OID@", "SHAPE@"]]
-
-            with arcpy.da.UpdateCursor(input_fc, ["OID@", "SHAPE@"] + field_names) as cursor:
-                for row in cursor:
-                    oid = row[0]
-                    geom = row[1]
-
-                    if geom and geom.type == "polygon":
-                        # Check for holes using NULL separators
-                        has_holes = False
-
-                        for part_index in range(geom.partCount):
-                            part = geom.getPart(part_index)
-                            if part:
-                                null_count = 0
-                                for point in part:
-                                    if point is None:
-                                        null_count += 1
-
-                                # NULL separators indicate interior rings (holes)
-                                if null_count > 0:
-                                    has_holes = True
-                                    break
-
-                        # Alternative check for multipart
-                        if not has_holes and self._is_truly_multipart(geom):
-                            has_holes = True
-
-                        if has_holes:
-                            try:
-                                # Extract exterior ring(s) to remove holes
-                                repaired_geom = self._extract_exterior_rings(geom, verbose)
-
-                                if repaired_geom and not repaired_geom.isEmpty:
-                                    # Update the geometry
-                                    row[1] = repaired_geom
-                                    cursor.updateRow(row)
-                                    repaired_count += 1
-
-                                    if verbose and repaired_count <= 5:
-                                        print_info("      Repaired OBJECTID {} (removed interior rings)".format(oid))
-                                else:
-                                    if verbose and repaired_count <= 5:
-                                        print_warning("      Could not repair OBJECTID {} - empty exterior ring".format(oid))
-
-                            except Exception as repair_error:
-                                if verbose and repaired_count <= 5:
-                                    print_warning("      Could not repair OBJECTID {}: {}".format(oid, repair_error))
-
-            if verbose:
-                print_info("    Successfully repaired {} polygons with holes".format(repaired_count))
-
-            return repaired_count
+                print_info("    Combined geometry pass failed: {}".format(e))
+            return 0, 0, 0
+
+    def _find_contained_oids(self, features):
+        """Return OIDs of features fully contained by another feature"""
+        contained_oids = set()
+
+        # Containment implies intersecting extents, so only envelope candidates are tested
+        valid = [(oid, geom) for oid, geom in features if geom]
+        if len(valid) < 2:
+            return contained_oids
+
+        boxes = []
+        for oid, geom in valid:
+            extent = geom.extent
+            boxes.append((extent.XMin, extent.YMin, extent.XMax, extent.YMax))
+
+        for i, j in self._envelope_candidate_pairs(boxes):
+            oid1, geom1 = valid[i]
+            oid2, geom2 = valid[j]
+
+            # A feature already marked as contained needs no further tests: anything it
+            # contains is also inside its container, which is tested against it directly
+            if oid1 in contained_oids or oid2 in contained_oids:
+                continue
+
+            if geom1.contains(geom2):
+                contained_oids.add(oid2)
+            elif geom2.contains(geom1):
+                contained_oids.add(oid1)
+
+        return contained_oids
+
+    def _oid_where_clauses(self, oids, batch_size=1000):
+        """Yield OBJECTID IN (...) where clauses covering the given OIDs in batches"""
+        oids = sorted(oids)
+        for start in range(0, len(oids), batch_size):
+            yield "OBJECTID IN ({})".format(",".join(str(oid) for oid in oids[start:start + batch_size]))
+
+    def _has_holes(self, geom):
+        """Check polygon for interior rings or true multipart parts"""
+        # The boundary has one path per ring, so extra paths beyond the part count are
+        # interior rings (holes) - no per-vertex scan for NULL separators needed
+        if geom.boundary().partCount > geom.partCount:
+            return True
 
-        except Exception as e:
-            if verbose:
-                print_warning("    Error removing polygons with holes: {}".format(e))
-            return 0
+        # Alternative check for multipart
+        return self._is_truly_multipart(geom)
 
     def _fix_geometries_simple(self, input_fc, verbose=False):
         """Comprehensive geometry cleaning using ArcPy tools"""
         try:
-            import arcpy
 
             if verbose:
                 print_info("    Starting comprehensive geometry cleaning...")
@@ -1144,10 +1053,9 @@ class PolygonSanitizer:
             if verbose:
                 print_info("    Geometry cleaning failed: {}".format(e))
 
-    def _fix_overlapping_pairs_iterative(self, input_fc, verbose=False, buffer_erase_cm=None):
+    def _fix_overlapping_pairs_iterative(self, input_fc, verbose=False, buffer_erase_cm=None, workers=None):
         """Fix overlapping pairs using iterative buffer-erase approach"""
         try:
-            import arcpy
 
             print_info("    Detecting overlapping pairs...")
 
@@ -1160,597 +1068,720 @@ class PolygonSanitizer:
 
             print_info("    Found {} overlapping pairs to resolve".format(len(overlap_pairs)))
 
-            pairs_resolved = 0
+            # parallelProcessingFactor "0" is the ArcGIS switch for no parallel work - honour it
+            parallel_allowed = str(arcpy.env.parallelProcessingFactor or "").strip() not in ("0", "0%")
 
-            # Process each overlapping pair
-            for pair_idx, (oid1, oid2) in enumerate(overlap_pairs, 1):
-                print_info("    Processing pair {} of {}: OBJECTID {} & OBJECTID {}".format(
-                    pair_idx, len(overlap_pairs), oid1, oid2))
+            if workers and workers > 1 and len(overlap_pairs) > 1 and parallel_allowed:
+                return self._fix_overlapping_pairs_parallel(input_fc, overlap_pairs, workers, verbose, buffer_erase_cm)
 
-                try:
-                    # Apply iterative buffer-erase resolution directly
-                    # (no need to re-check overlap since we just detected them)
-                    print_info("      Starting iterative buffer-erase resolution...")
-                    if self._resolve_pair_iterative_buffer_erase(input_fc, oid1, oid2, verbose, buffer_erase_cm):
-                        print_info("      Successfully resolved overlapping pair")
-                        pairs_resolved += 1
-                    else:
-                        print_info("      Failed to resolve overlapping pair")
-
-                except Exception as e:
-                    print_info("      Error resolving pair: {}".format(e))
-
-            return pairs_resolved
+            return self._resolve_pairs_batched(input_fc, overlap_pairs, verbose, buffer_erase_cm)
 
         except Exception as e:
             print_info("    Error fixing overlapping pairs: {}".format(e))
             return 0
 
-    def _detect_overlapping_pairs(self, input_fc, verbose=False):
+    def _fix_overlapping_pairs_parallel(self, input_fc, overlap_pairs, workers, verbose=False, buffer_erase_cm=None):
         """
-        Detect overlapping feature pairs using comprehensive 5-method detection
-        Same logic as validate command's _validate_overlapping_polygons
+        Resolve overlapping pairs in rounds of independent pairs using a process pool
+
+        Workers only read the feature class and compute the erased geometry; all writes
+        happen here between rounds, since a file geodatabase allows a single writer.
+
+        Args:
+            input_fc (str): Path to input feature class
+            overlap_pairs (list): (oid1, oid2) pairs from _detect_overlapping_pairs
+            workers (int): Number of worker processes
+            verbose (bool): Enable verbose output
+            buffer_erase_cm (float): Specific buffer distance in cm (default: iterate 1-80cm)
+
+        Returns:
+            int: Number of pairs resolved
         """
+        import multiprocessing
+
+        rounds = self._independent_pair_rounds(overlap_pairs)
+        print_info("    Resolving pairs in {} rounds with {} workers...".format(len(rounds), workers))
+
+        pairs_resolved = 0
+        pool = multiprocessing.Pool(processes=workers)
         try:
-            import arcpy
+            for round_idx, round_pairs in enumerate(rounds, 1):
+                tasks = [(input_fc, oid1, oid2, buffer_erase_cm) for oid1, oid2 in round_pairs]
+                results = pool.map(_resolve_pair_worker, tasks, chunksize=1)
+
+                updates = {}
+                deletes = set()
+                for oid1, oid2, resolved, action, geometry_json in results:
+                    if action == "update":
+                        updates[oid2] = arcpy.AsShape(json.loads(geometry_json), True)
+                    elif action == "delete":
+                        deletes.add(oid2)
+
+                # Pairs in a round share no OBJECTIDs, so their edits can be applied together
+                self._apply_shape_edits(input_fc, updates, deletes)
+
+                # A specific distance is applied once and counts as resolved (continuing process)
+                if buffer_erase_cm is not None:
+                    unresolved = set()
+                else:
+                    unresolved = self._verify_overlaps_resolved_bulk(input_fc, round_pairs)
 
-            overlap_pairs = []
+                for pair in round_pairs:
+                    if pair not in unresolved:
+                        pairs_resolved += 1
+                    if verbose:
+                        print_info("      OBJECTID {} & OBJECTID {}: {}".format(
+                            pair[0], pair[1], "not resolved" if pair in unresolved else "resolved"))
 
-            # Create feature layer
-            layer_name = "temp_overlap_detection"
-            if arcpy.Exists(layer_name):
-                arcpy.management.Delete(layer_name)
-            arcpy.management.MakeFeatureLayer(input_fc, layer_name)
+                print_info("    Round {} of {}: {} pairs processed".format(round_idx, len(rounds), len(round_pairs)))
+        finally:
+            pool.close()
+            pool.join()
 
-            # Get all features - same format as validate
-            geometries = []
-            with arcpy.da.SearchCursor(layer_name, ["OID@", "SHAPE@"]) as cursor:
-                for oid, geom in cursor:
-                    if geom and hasattr(geom, 'area'):
-                        geometries.append((oid, geom))
+        return pairs_resolved
 
-            if len(geometries) < 2:
-                if arcpy.Exists(layer_name):
-                    arcpy.management.Delete(layer_name)
-                return overlap_pairs
+    def _independent_pair_rounds(self, pairs):
+        """
+        Group pairs into rounds in which no OBJECTID appears twice
 
-            print_info("    Performing comprehensive overlap analysis using 5 detection methods...")
+        A pair is placed in the round after the last one that touched either of its
+        OBJECTIDs, so edits to each feature still happen in the original pair order.
+        """
+        rounds = []
+        last_round = {}
 
-            # Phase 1: ArcPy SelectLayerByLocation method (most comprehensive) - same as validate
-            print_info("    Using ArcPy SelectLayerByLocation for comprehensive intersection detection...")
-            arcpy_intersect_pairs = []
+        for oid1, oid2 in pairs:
+            round_idx = max(last_round.get(oid1, -1), last_round.get(oid2, -1)) + 1
+            if round_idx == len(rounds):
+                rounds.append([])
+            rounds[round_idx].append((oid1, oid2))
+            last_round[oid1] = round_idx
+            last_round[oid2] = round_idx
 
-            try:
-                # Create a temporary feature layer for spatial queries - same as validate
-                arcpy.MakeFeatureLayer_management(input_fc, "temp_overlap_layer")
+        return rounds
 
-                # For each feature, find all intersecting features using SelectLayerByLocation - same as validate
-                for oid, geom in geometries:
-                    # Create a layer with just this feature
-                    arcpy.SelectLayerByAttribute_management("temp_overlap_layer", "NEW_SELECTION", "OBJECTID = {}".format(oid))
+    def _resolve_pairs_batched(self, input_fc, overlap_pairs, verbose=False, buffer_erase_cm=None):
+        """
+        Resolve overlapping pairs with one Buffer call per distance for a whole round
 
-                    # Find all features that intersect this feature (excluding itself) - same as validate
-                    arcpy.SelectLayerByLocation_management("temp_overlap_layer", "INTERSECT", "temp_overlap_layer", "", "NEW_SELECTION")
+        Pairs are grouped into rounds without shared OBJECTIDs. Within a round every
+        pair searches its buffer distance in lockstep, so all pairs trying the same
+        distance share one Buffer_analysis call. Each buffered first feature is then
+        erased from its own second feature only, and the round is written back with
+        one UpdateCursor pass.
 
-                    # Get the intersecting OBJECTIDs
-                    with arcpy.da.SearchCursor("temp_overlap_layer", ["OBJECTID"]) as cursor:
-                        intersecting_oids = [row[0] for row in cursor if row[0] != oid]
+        Args:
+            input_fc (str): Path to input feature class
+            overlap_pairs (list): (oid1, oid2) pairs from _detect_overlapping_pairs
+            verbose (bool): Enable verbose output
+            buffer_erase_cm (float): Specific buffer distance in cm (default: search 1-80cm)
 
-                        for intersect_oid in intersecting_oids:
-                            # Ensure consistent ordering and avoid duplicates
-                            pair = tuple(sorted([oid, intersect_oid]))
-                            if pair not in arcpy_intersect_pairs:
-                                arcpy_intersect_pairs.append(pair)
+        Returns:
+            int: Number of pairs resolved
+        """
 
-                # Clean up the temporary layer
-                arcpy.Delete_management("temp_overlap_layer")
+        if buffer_erase_cm is not None:
+            print_info("      Using specific buffer distance: {}cm".format(buffer_erase_cm))
 
-                print_info("    ArcPy method found {} intersecting pairs".format(len(arcpy_intersect_pairs)))
+            # Warning for very large buffer distances that may erase features
+            if buffer_erase_cm > 50:  # Warning for buffers > 50cm
+                print_info("      WARNING: Large buffer distance ({}cm) may erase entire features".format(buffer_erase_cm))
+                print_info("      Consider using smaller values (5-30cm) for typical parcel data")
 
-            except Exception as arcpy_error:
+        pairs_resolved = 0
+        rounds = self._independent_pair_rounds(overlap_pairs)
+
+        for round_idx, round_pairs in enumerate(rounds, 1):
+            print_info("    Round {} of {}: resolving {} pairs...".format(round_idx, len(rounds), len(round_pairs)))
+
+            # Read the current shapes of every feature in the round at once
+            round_oids = set()
+            for oid1, oid2 in round_pairs:
+                round_oids.add(oid1)
+                round_oids.add(oid2)
+
+            geometries = {}
+            for where_clause in self._oid_where_clauses(round_oids):
+                with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"], where_clause) as cursor:
+                    for oid, geom in cursor:
+                        if geom:
+                            geometries[oid] = geom
+
+            pending = [pair for pair in round_pairs if pair[0] in geometries and pair[1] in geometries]
+
+            # pair -> {cm: (resolved, erased_geometry)}
+            attempts = dict((pair, {}) for pair in pending)
+
+            if buffer_erase_cm is not None:
+                results = self._batch_buffer_erase(pending, geometries, "{} Meters".format(buffer_erase_cm / 100.0))
+                for pair in pending:
+                    # A specific distance is applied once and counts as resolved
+                    attempts[pair][buffer_erase_cm] = (True, results.get(pair, geometries[pair[1]]))
+            else:
+                while True:
+                    # Group the pairs by the distance each one needs to try next
+                    by_cm = {}
+                    for pair in pending:
+                        tried = dict((cm, result[0]) for cm, result in attempts[pair].items())
+                        cm = self._next_buffer_cm(tried)
+                        if cm is not None:
+                            by_cm.setdefault(cm, []).append(pair)
+
+                    if not by_cm:
+                        break
+
+                    for cm in sorted(by_cm):
+                        if verbose:
+                            print_info("        Trying {} buffer distance on {} pairs...".format(
+                                _BUFFER_DISTANCES_CM[cm - 1], len(by_cm[cm])))
+
+                        results = self._batch_buffer_erase(by_cm[cm], geometries, _BUFFER_DISTANCES_CM[cm - 1])
+                        for pair in by_cm[cm]:
+                            erased_geometry = results.get(pair, geometries[pair[1]])
+                            resolved = erased_geometry is None or erased_geometry.disjoint(geometries[pair[0]])
+                            attempts[pair][cm] = (resolved, erased_geometry)
+
+            # Apply the chosen result of every pair in one write pass
+            updates = {}
+            deletes = set()
+            for pair in pending:
+                tried = dict((cm, result[0]) for cm, result in attempts[pair].items())
+                resolved, best_cm = self._best_buffer_cm(tried)
+                erased_geometry = attempts[pair][best_cm][1]
+
+                if erased_geometry is None:
+                    deletes.add(pair[1])
+                else:
+                    updates[pair[1]] = erased_geometry
+
+            self._apply_shape_edits(input_fc, updates, deletes)
+
+            # Check the stored shapes, since writing can snap vertices to the feature class resolution.
+            # A specific distance is applied once and counts as resolved (continuing process).
+            if buffer_erase_cm is not None:
+                unresolved = set()
+            else:
+                unresolved = self._verify_overlaps_resolved_bulk(input_fc, pending)
+
+            for pair in pending:
+                if pair not in unresolved:
+                    pairs_resolved += 1
                 if verbose:
-                    print_info("    ArcPy SelectLayerByLocation method failed: {}".format(str(arcpy_error)))
-                arcpy_intersect_pairs = []
+                    print_info("      OBJECTID {} & OBJECTID {}: {}".format(
+                        pair[0], pair[1], "not resolved" if pair in unresolved else "resolved"))
 
-            # Phase 2: Enhanced pairwise validation using multiple geometry methods - same as validate
-            print_info("    Performing detailed geometry analysis for all {} pairs...".format(len(geometries) * (len(geometries) - 1) // 2))
+        return pairs_resolved
 
-            processed_pairs = set()
+    def _apply_shape_edits(self, input_fc, updates, deletes):
+        """
+        Write new shapes and delete features in one edit operation
 
-            for i in range(len(geometries)):
-                for j in range(i + 1, len(geometries)):
-                    # Extract OBJECTID and geometry - same as validate
-                    oid1 = geometries[i][0]
-                    oid2 = geometries[j][0]
-                    geom1 = geometries[i][1]
-                    geom2 = geometries[j][1]
+        Args:
+            input_fc (str): Path to input feature class
+            updates (dict): OBJECTID -> new geometry
+            deletes (set): OBJECTIDs to delete
+        """
 
-                    # Skip invalid geometries
-                    if not geom1 or not geom2:
-                        continue
+        if not updates and not deletes:
+            return
 
-                    # Create ordered pair to avoid duplicates
-                    pair = tuple(sorted([oid1, oid2]))
-                    if pair in processed_pairs:
-                        continue
-                    processed_pairs.add(pair)
+        # One edit session commits all batches together instead of row by row
+        with arcpy.da.Editor(os.path.dirname(input_fc)):
+            for where_clause in self._oid_where_clauses(set(updates) | deletes):
+                with arcpy.da.UpdateCursor(input_fc, ["OID@", "SHAPE@"], where_clause) as cursor:
+                    for oid, geom in cursor:
+                        if oid in deletes:
+                            cursor.deleteRow()
+                        else:
+                            cursor.updateRow([oid, updates[oid]])
 
-                    try:
-                        # Check if this pair was detected by ArcPy method
-                        arcpy_detected = pair in arcpy_intersect_pairs
-
-                        # Perform comprehensive overlap detection using 5 methods - same as validate
-                        overlap_detected = False
-                        overlap_area = 0.0
-                        overlap_type = ""
-
-                        # Method 1: ArcPy detection using [intersect analysis] (most reliable)
-                        if arcpy_detected:
-                            overlap_detected = True
-                            overlap_type = "arcpy_intersect"
-                            # Calculate actual intersection area using bracket analysis
-                            intersect_geom = geom1.intersect(geom2, 4)
-                            if intersect_geom:
-                                overlap_area = intersect_geom.area
-
-                        # Method 2: geom_overlaps functionality using direct overlap detection
-                        elif geom1.overlaps(geom2):
-                            overlap_detected = True
-                            overlap_geom = geom1.intersect(geom2, 4)
-                            if overlap_geom:
-                                overlap_area = overlap_geom.area
-                            overlap_type = "geom_overlaps"
-
-                        # Method 3: Intersection analysis using [intersect geometry] detection
-                        elif not overlap_detected:
-                            intersect_geom = geom1.intersect(geom2, 4)
-                            if intersect_geom and intersect_geom.area > 0.0001:
-                                overlap_detected = True
-                                overlap_area = intersect_geom.area
-                                overlap_type = "intersect_analysis"
-
-                        # Method 4: Containment detection
-                        elif geom1.contains(geom2) or geom2.contains(geom1):
-                            overlap_detected = True
-                            overlap_area = min(geom1.area, geom2.area)
-                            overlap_type = "containment"
-
-                        # Method 5: Boundary touching detection
-                        if geom1.touches(geom2):
-                            overlap_detected = True
-                            overlap_area = 0.0
-                            if not overlap_type:
-                                overlap_type = "boundary_touch"
-
-                        # If overlap detected, record it - same logic as validate
-                        if overlap_detected:
-                            # Only add as overlap pair if it's not just boundary touching OR has meaningful overlap
-                            if not (overlap_type == "boundary_touch" and overlap_area <= 0.0001):
-                                overlap_pairs.append(pair)
+    def _batch_buffer_erase(self, pairs, geometries, buffer_distance):
+        """
+        Buffer the first feature of every pair with one Buffer call and erase it from the second
 
-                                if verbose:
-                                    # Calculate overlap statistics
-                                    area1 = geom1.area
-                                    area2 = geom2.area
-                                    min_area = min(area1, area2)
-                                    overlap_percent = (overlap_area / min_area * 100) if min_area > 0 else 0
-
-                                    # Enhanced messaging with bracket analysis and geom_overlaps terminology
-                                    if overlap_type == "arcpy_intersect":
-                                        method_desc = "overlapping polygons using [intersect analysis] (ArcPy)"
-                                    elif overlap_type == "geom_overlaps":
-                                        method_desc = "overlapping polygons using geom_overlaps functionality"
-                                    elif overlap_type == "intersect_analysis":
-                                        method_desc = "overlapping polygons using [intersect geometry] analysis"
-                                    else:
-                                        method_desc = "overlapping polygons - type: {}".format(overlap_type)
-
-                                    print_info("      Found {}: OBJECTID {} & OBJECTID {} - area: {:.2f} ({:.1f}%)".format(
-                                        method_desc, oid1, oid2, overlap_area, overlap_percent))
-
-                    except Exception as geom_error:
-                        if verbose:
-                            print_info("      Geometry comparison error between OBJECTID {} and {}: {}".format(oid1, oid2, str(geom_error)))
+        Erase_analysis would erase every target with the union of all buffers, so the
+        erase itself is done per pair on the buffered geometry.
+
+        Args:
+            pairs (list): (oid1, oid2) pairs sharing no OBJECTIDs
+            geometries (dict): OBJECTID -> geometry for every feature in pairs
+            buffer_distance (str): Linear unit string, e.g. "0.05 Meters"
+
+        Returns:
+            dict: (oid1, oid2) -> erased geometry, or None when nothing is left
+        """
+
+        erasers_fc = "in_memory\\batch_erasers"
+        buffered_fc = "in_memory\\batch_buffered"
+        results = {}
+
+        if not pairs:
+            return results
+
+        # Leftovers from an interrupted run are overwritten rather than probed and deleted
+        arcpy.env.overwriteOutput = True
+
+        try:
+            arcpy.management.CreateFeatureclass("in_memory", "batch_erasers", "POLYGON",
+                                                spatial_reference=geometries[pairs[0][0]].spatialReference)
+
+            # insertRow returns the new OBJECTID, which Buffer reports back as ORIG_FID
+            pair_by_fid = {}
+            with arcpy.da.InsertCursor(erasers_fc, ["SHAPE@"]) as cursor:
+                for pair in pairs:
+                    pair_by_fid[cursor.insertRow([geometries[pair[0]]])] = pair
+
+            self._buffer_analysis(erasers_fc, buffered_fc, buffer_distance)
+
+            with arcpy.da.SearchCursor(buffered_fc, ["ORIG_FID", "SHAPE@"]) as cursor:
+                for orig_fid, buffered in cursor:
+                    pair = pair_by_fid.get(orig_fid)
+                    if pair is None or not buffered:
                         continue
 
-            # Clean up
-            if arcpy.Exists(layer_name):
-                arcpy.management.Delete(layer_name)
+                    erased_geometry = geometries[pair[1]].difference(buffered)
+                    if not erased_geometry or erased_geometry.pointCount == 0:
+                        erased_geometry = None
+                    results[pair] = erased_geometry
 
-            print_info("    Comprehensive detection found {} overlapping pairs".format(len(overlap_pairs)))
-            return overlap_pairs
+            return results
 
-        except Exception as e:
-            print_info("    Error detecting overlapping pairs: {}".format(e))
-            return []
+        finally:
+            self._delete_temp(erasers_fc, buffered_fc)
+
+    def _delete_temp(self, *temp_paths):
+        """Delete temporary datasets, ignoring any that were never created"""
+
+        for temp_path in temp_paths:
+            try:
+                arcpy.management.Delete(temp_path)
+            except:
+                pass
+
+    def _buffer_analysis(self, in_features, out_features, buffer_distance):
+        """Buffer with PairwiseBuffer where the install has it (ArcGIS Pro), else Buffer_analysis"""
+
+        pairwise_buffer = getattr(arcpy.analysis, "PairwiseBuffer", None)
+        if pairwise_buffer is not None:
+            self._run_pairwise(pairwise_buffer, in_features, out_features, buffer_distance)
+        else:
+            arcpy.Buffer_analysis(in_features, out_features, buffer_distance)
 
-    def _features_overlap(self, input_fc, oid1, oid2):
-        """Check if two features overlap in the feature class using comprehensive 5-method detection"""
+    def _erase_analysis(self, in_features, erase_features, out_features):
+        """Erase with PairwiseErase where the install has it (ArcGIS Pro), else Erase_analysis"""
+
+        pairwise_erase = getattr(arcpy.analysis, "PairwiseErase", None)
+        if pairwise_erase is not None:
+            self._run_pairwise(pairwise_erase, in_features, erase_features, out_features)
+        else:
+            arcpy.Erase_analysis(in_features, erase_features, out_features)
+
+    def _run_pairwise(self, tool, *args):
+        """Run a Pairwise tool on every core unless the caller chose a factor, then restore the setting"""
+
+        previous_factor = arcpy.env.parallelProcessingFactor
+        if not previous_factor:
+            arcpy.env.parallelProcessingFactor = "100%"
         try:
-            import arcpy
+            tool(*args)
+        finally:
+            arcpy.env.parallelProcessingFactor = previous_factor
 
-            # Get geometries
-            geom1 = None
-            geom2 = None
-            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"], "OBJECTID IN ({}, {})".format(oid1, oid2)) as cursor:
-                for oid, geom in cursor:
-                    if oid == oid1:
-                        geom1 = geom
-                    elif oid == oid2:
-                        geom2 = geom
+    def _next_buffer_cm(self, tried):
+        """
+        Return the next buffer distance (cm) to try, or None when the search is done
 
-            if not geom1 or not geom2:
-                return False
+        A larger buffer always erases more, so instead of trying every distance from
+        1cm upwards the smallest resolving distance is found by probing _BUFFER_PROBES_CM
+        and then bisecting between the last failing and first resolving probe.
 
-            # Use comprehensive 5-method overlap detection - same as validate
-            return self._comprehensive_overlap_check(geom1, geom2)
+        Args:
+            tried (dict): cm -> resolved for the distances tried so far
+        """
+        resolved_cms = [cm for cm, resolved in tried.items() if resolved]
 
-        except:
-            return False
+        if not resolved_cms:
+            for cm in _BUFFER_PROBES_CM:
+                if cm not in tried:
+                    return cm
+            return None
+
+        first_resolved = min(resolved_cms)
+        last_failed = max([cm for cm, resolved in tried.items() if not resolved and cm < first_resolved] or [0])
+        if first_resolved - last_failed > 1:
+            return (last_failed + first_resolved) // 2
+        return None
+
+    def _best_buffer_cm(self, tried):
+        """Return (resolved, cm): the smallest resolving distance, else the largest one tried"""
+        resolved_cms = [cm for cm, resolved in tried.items() if resolved]
+        if resolved_cms:
+            return True, min(resolved_cms)
+        return False, max(tried)
 
-    def _comprehensive_overlap_check(self, geom1, geom2):
+    def _compute_pair_buffer_erase(self, input_fc, oid1, oid2, buffer_erase_cm=None, verbose=False):
         """
-        Comprehensive overlap check using 5 methods - same logic as validate
+        Compute the buffer-erase result for one pair without editing the feature class
+
+        Runs Buffer/Erase on copies of the two features, searching distances with
+        _next_buffer_cm. Each distance is applied to the original second feature.
+
+        Returns:
+            tuple: (oid1, oid2, resolved, action, geometry) where action is
+                   "update", "delete" or None
         """
-        try:
-            overlap_detected = False
-            overlap_area = 0.0
-            overlap_type = ""
-
-            # Method 1: ArcPy SelectLayerByLocation simulation - use direct geometry check
-            # (We can't use SelectLayerByLocation here for individual geometries, so we use direct methods)
-
-            # Method 2: Direct overlap detection
-            if geom1.overlaps(geom2):
-                overlap_detected = True
-                overlap_geom = geom1.intersect(geom2, 4)
-                if overlap_geom:
-                    overlap_area = overlap_geom.area
-                overlap_type = "overlap"
-
-            # Method 3: Intersection area detection
-            if not overlap_detected:
-                intersect_geom = geom1.intersect(geom2, 4)
-                if intersect_geom and intersect_geom.area > 0.0001:
-                    overlap_detected = True
-                    overlap_area = intersect_geom.area
-                    overlap_type = "intersection"
-
-            # Method 4: Containment detection
-            if not overlap_detected and (geom1.contains(geom2) or geom2.contains(geom1)):
-                overlap_detected = True
-                overlap_area = min(geom1.area, geom2.area)
-                overlap_type = "containment"
-
-            # Method 5: Boundary touching detection
-            boundary_touches = geom1.touches(geom2)
-            if boundary_touches:
-                overlap_detected = True
-                overlap_area = 0.0
-                if not overlap_type:
-                    overlap_type = "boundary_touch"
-
-            # Only consider it an actual overlap if it's not just boundary touching OR has meaningful overlap
-            return overlap_detected and not (overlap_type == "boundary_touch" and overlap_area <= 0.0001)
-
-        except:
-            return False
 
-    def _resolve_pair_iterative_buffer_erase(self, input_fc, oid1, oid2, verbose=False, buffer_erase_cm=None):
-        """Resolve overlapping pair using iterative buffer-erase with progressive tolerances"""
-        try:
-            import arcpy
+        arcpy.env.overwriteOutput = True
 
-            # Check if specific buffer distance is provided
-            if buffer_erase_cm is not None:
-                print_info("      Using specific buffer distance: {}cm".format(buffer_erase_cm))
-                buffer_distance = "{} Meters".format(buffer_erase_cm / 100.0)
+        # in_memory is private to each worker process and the temporaries are deleted on
+        # exit, so the pair's OIDs are enough to keep the names apart
+        temp_feature1 = "in_memory\\temp_feature1_{}".format(oid1)
+        temp_feature2 = "in_memory\\temp_feature2_{}".format(oid2)
+        temp_buffered = "in_memory\\temp_buffered_{}".format(oid1)
+        temp_erased = "in_memory\\temp_erased_{}".format(oid2)
+        temp_subdivided = "in_memory\\temp_subdivided_{}".format(oid1)
 
-                # Warning for very large buffer distances that may erase features
-                if buffer_erase_cm > 50:  # Warning for buffers > 50cm
-                    print_info("      WARNING: Large buffer distance ({}cm) may erase entire features".format(buffer_erase_cm))
-                    print_info("      Consider using smaller values (5-30cm) for typical parcel data")
+        try:
+            # One OBJECTID IN (...) read for both features instead of a Select per feature
+            geometries = {}
+            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"], "OBJECTID IN ({}, {})".format(oid1, oid2)) as cursor:
+                for oid, geom in cursor:
+                    if geom:
+                        geometries[oid] = geom
 
-                print_info("        Applying {} buffer distance...".format(buffer_distance))
+            geom1 = geometries.get(oid1)
+            if geom1 is None:
+                return oid1, oid2, False, None, None
 
-                # Apply buffer-erase operation once with specific distance
-                if self._apply_buffer_erase_operation(input_fc, oid1, oid2, buffer_distance, verbose):
-                    print_info("        Buffer-erase operation completed with {}".format(buffer_distance))
+            # The second feature is already gone - nothing left to erase
+            if oid2 not in geometries:
+                return oid1, oid2, True, None, None
 
-                    # Continue processing even if overlap may remain (as requested)
-                    print_info("        Buffer-erase applied with {} (continuing process)".format(buffer_distance))
-                    return True
-                else:
-                    print_info("        Buffer-erase operation failed with {}".format(buffer_distance))
-                    return False
-            else:
-                print_info("      Starting iterative buffer-erase resolution...")
+            arcpy.CopyFeatures_management([geom1], temp_feature1)
+            arcpy.CopyFeatures_management([geometries[oid2]], temp_feature2)
 
-                # Buffer distances: 1cm, 2cm, 3cm, ..., 80cm (1cm increments)
-                buffer_distances = []
-                for cm in range(1, 81):  # 1cm to 80cm in steps of 1cm
-                    meters = cm / 100.0  # Convert cm to meters
-                    buffer_distances.append("{} Meters".format(meters))
+            # Erase cost grows with eraser vertices times target vertices; splitting a very
+            # large eraser into parts keeps each intersection small (ArcGIS Pro only)
+            subdivide_polygon = getattr(arcpy.management, "SubdividePolygon", None)
+            subdivide = subdivide_polygon is not None and geom1.pointCount > _SUBDIVIDE_POINT_COUNT
 
-                # Skip overlap check since we already detected them with comprehensive method
+            def erase_with(buffer_distance):
+                """Buffer-erase the second feature, returning (resolved, erased_geometry)"""
                 if verbose:
-                    print_info("      Proceeding with buffer-erase resolution (overlap pre-detected)...")
+                    print_info("        Trying {} buffer distance...".format(buffer_distance))
 
-                for buffer_idx, buffer_distance in enumerate(buffer_distances, 1):
-                    print_info("        Iteration {}: Trying {} buffer distance...".format(buffer_idx, buffer_distance))
+                self._buffer_analysis(temp_feature1, temp_buffered, buffer_distance)
+                erase_features = temp_buffered
+                if subdivide:
+                    subdivide_polygon(temp_buffered, temp_subdivided, "NUMBER_OF_EQUAL_PARTS", 8)
+                    erase_features = temp_subdivided
+                self._erase_analysis(temp_feature2, erase_features, temp_erased)
 
-                    # Apply buffer-erase operation following the reference pattern
-                    if self._apply_buffer_erase_operation(input_fc, oid1, oid2, buffer_distance, verbose):
-                        print_info("        Buffer-erase operation completed with {}".format(buffer_distance))
+                erased_geometry = None
+                with arcpy.da.SearchCursor(temp_erased, ["SHAPE@"]) as cursor:
+                    for geom, in cursor:
+                        erased_geometry = geom
+                        break
 
-                        # Verify if overlap is actually resolved after this buffer-erase
-                        if self._verify_overlap_resolved(input_fc, oid1, oid2, verbose):
-                            print_info("        Overlap resolved with {} buffer distance".format(buffer_distance))
-                            return True
-                        else:
-                            print_info("        Overlap still exists, trying larger buffer...")
-                    else:
-                        print_info("        Buffer-erase operation failed with {}".format(buffer_distance))
+                # No geometry left after erase - the feature is removed, which resolves the pair
+                if erased_geometry is None:
+                    return True, None
+                return erased_geometry.disjoint(geom1), erased_geometry
 
-                print_info("        Failed to resolve overlap after all buffer distances")
-                return False
+            # A specific distance is applied once, like the sequential path
+            if buffer_erase_cm is not None:
+                resolved, erased_geometry = erase_with("{} Meters".format(buffer_erase_cm / 100.0))
+                if erased_geometry is None:
+                    return oid1, oid2, True, "delete", None
+                return oid1, oid2, True, "update", erased_geometry
 
-        except Exception as e:
-            print_info("        Error in iterative buffer-erase resolution: {}".format(e))
-            return False
+            attempts = {}
+            cm = self._next_buffer_cm({})
+            while cm is not None:
+                attempts[cm] = erase_with(_BUFFER_DISTANCES_CM[cm - 1])
+                cm = self._next_buffer_cm(dict((k, v[0]) for k, v in attempts.items()))
+
+            resolved, best_cm = self._best_buffer_cm(dict((k, v[0]) for k, v in attempts.items()))
+            erased_geometry = attempts[best_cm][1]
+
+            if verbose and resolved:
+                print_info("        Overlap resolved with {} buffer distance".format(_BUFFER_DISTANCES_CM[best_cm - 1]))
 
-    def _apply_buffer_erase_operation(self, input_fc, oid1, oid2, buffer_distance, verbose=False):
+            # Keep the last (largest) erase even when the overlap remains
+            if erased_geometry is None:
+                return oid1, oid2, resolved, "delete", None
+            return oid1, oid2, resolved, "update", erased_geometry
+
+        finally:
+            self._delete_temp(temp_feature1, temp_feature2, temp_buffered, temp_erased, temp_subdivided)
+
+    def _detect_overlapping_pairs(self, input_fc, verbose=False):
         """
-        Apply buffer-erase operation following the working reference pattern:
-        1. Buffer the first feature
-        2. Erase the second feature using the buffered feature
-        3. Retain the unbuffered first feature and erased second feature
+        Detect overlapping feature pairs using comprehensive 5-method detection
+        Same logic as validate command's _validate_overlapping_polygons
         """
         try:
-            import arcpy
 
-            # Set environment
-            arcpy.env.overwriteOutput = True
-            workspace = os.path.dirname(input_fc)
+            overlap_pairs = []
 
-            # Create temporary feature classes - following reference naming pattern
-            timestamp = str(int(__import__('time').time() * 1000))
+            # Get all features - same format as validate. Area and extent are read once per
+            # feature here, since each property access goes through the ArcPy geometry object.
+            # Envelopes are kept as plain floats so the spatial index gets one contiguous array.
+            geometries = []
+            areas = []
+            boxes = []
+            # The cursor reads the feature class directly - no feature layer is needed
+            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"]) as cursor:
+                for oid, geom in cursor:
+                    if not geom:
+                        continue
+                    try:
+                        area = geom.area
+                    except Exception:
+                        continue
+                    geometries.append((oid, geom))
+                    areas.append(area)
+                    extent = geom.extent
+                    boxes.append((extent.XMin, extent.YMin, extent.XMax, extent.YMax))
 
-            # Temporary paths in in_memory workspace (FIXED - this is the correct format)
-            temp_feature1 = "in_memory\\temp_feature1_{}".format(oid1)
-            temp_feature2 = "in_memory\\temp_feature2_{}".format(oid2)
-            temp_buffered = "in_memory\\temp_buffered_{}".format(oid1)
-            temp_erased = "in_memory\\temp_erased_{}".format(oid2)
+            if len(geometries) < 2:
+                return overlap_pairs
 
-            # Clean up any existing temp files
-            for temp_path in [temp_feature1, temp_feature2, temp_buffered, temp_erased]:
-                if arcpy.Exists(temp_path):
-                    arcpy.management.Delete(temp_path)
+            print_info("    Performing comprehensive overlap analysis using 5 detection methods...")
+
+            # Phase 1: ArcPy INTERSECT spatial relationship (most comprehensive) - same rule as validate
+            print_info("    Using ArcPy spatial join for comprehensive intersection detection...")
+            arcpy_intersect_pairs = set()
+            join_fc = "in_memory\\temp_overlap_join"
 
             try:
-                # Step 1: Extract the two overlapping features - use direct ArcPy methods like reference
-                arcpy.Select_analysis(input_fc, temp_feature1, "OBJECTID = {}".format(oid1))
-                arcpy.Select_analysis(input_fc, temp_feature2, "OBJECTID = {}".format(oid2))
+                # One self spatial join finds every intersecting pair in a single tool call,
+                # using the same INTERSECT rule as SelectLayerByLocation. Empty field mappings
+                # keep only TARGET_FID/JOIN_FID in the output.
+                arcpy.SpatialJoin_analysis(input_fc, input_fc, join_fc, "JOIN_ONE_TO_MANY", "KEEP_COMMON",
+                                           arcpy.FieldMappings(), "INTERSECT")
+
+                # Get the intersecting OBJECTID pairs (excluding each feature joined to itself)
+                with arcpy.da.SearchCursor(join_fc, ["TARGET_FID", "JOIN_FID"]) as cursor:
+                    for oid, intersect_oid in cursor:
+                        if oid == intersect_oid:
+                            continue
 
-                if not arcpy.Exists(temp_feature1) or not arcpy.Exists(temp_feature2):
-                    if verbose:
-                        print_info("          Failed to extract features OBJECTID {} and {}".format(oid1, oid2))
-                    return False
+                        # Ensure consistent ordering - the set drops duplicates
+                        arcpy_intersect_pairs.add(tuple(sorted([oid, intersect_oid])))
 
-                # Step 2: Buffer the first feature (this is the erase boundary) - use direct ArcPy method
-                arcpy.Buffer_analysis(temp_feature1, temp_buffered, buffer_distance)
+                print_info("    ArcPy method found {} intersecting pairs".format(len(arcpy_intersect_pairs)))
 
-                if not arcpy.Exists(temp_buffered):
-                    if verbose:
-                        print_info("          Failed to create buffer for OBJECTID {}".format(oid1))
-                    return False
+            except Exception as arcpy_error:
+                if verbose:
+                    print_info("    ArcPy spatial join method failed: {}".format(str(arcpy_error)))
+                arcpy_intersect_pairs = set()
 
-                # Step 3: Erase the second feature using the buffered feature - use direct ArcPy method
-                arcpy.Erase_analysis(temp_feature2, temp_buffered, temp_erased)
+            finally:
+                # Clean up the temporary join output
+                self._delete_temp(join_fc)
 
-                if not arcpy.Exists(temp_erased):
-                    if verbose:
-                        print_info("          Failed to erase OBJECTID {} using buffered OBJECTID {}".format(oid2, oid1))
-                    return False
-
-                # Step 4: Update the original feature class
-                # Keep the first feature unbuffered (as it was originally)
-                # Update the second feature with the erased geometry
-
-                # Check if erase result has features
-                erase_count = int(arcpy.management.GetCount(temp_erased)[0])
-
-                if erase_count > 0:
-                    # Get the erased geometry
-                    erased_geometry = None
-                    with arcpy.da.SearchCursor(temp_erased, ["SHAPE@"]) as cursor:
-                        for geom, in cursor:
-                            erased_geometry = geom
-                            break
+            # Phase 2: Enhanced pairwise validation using multiple geometry methods - same as validate
+            # Only pairs whose extents intersect can overlap or touch, so use an envelope index
+            candidate_pairs = self._envelope_candidate_pairs(boxes)
+            print_info("    Performing detailed geometry analysis for {} candidate pairs (of {} total)...".format(
+                len(candidate_pairs), len(geometries) * (len(geometries) - 1) // 2))
 
-                    if erased_geometry:
-                        # Update the second feature in the original feature class
-                        updated = False
-                        with arcpy.da.UpdateCursor(input_fc, ["SHAPE@"], "OBJECTID = {}".format(oid2)) as cursor:
-                            for row in cursor:
-                                try:
-                                    cursor.updateRow([erased_geometry])
-                                    updated = True
-                                    break
-                                except Exception as e:
-                                    if verbose:
-                                        print_info("          Failed to update OBJECTID {}: {}".format(oid2, e))
-                                    break
-
-                        if updated:
-                            if verbose:
-                                print_info("          Successfully updated OBJECTID {} with erased geometry".format(oid2))
-                            return True
-                        else:
-                            if verbose:
-                                print_info("          Failed to update OBJECTID {} with erased geometry".format(oid2))
-                            return False
-                    else:
-                        if verbose:
-                            print_info("          No erased geometry found in result")
-                        return False
-                else:
-                    # No geometry left after erase - remove the feature entirely
-                    try:
-                        arcpy.MakeFeatureLayer_management(input_fc, "temp_erase_layer", "OBJECTID = {}".format(oid2))
-                        arcpy.DeleteFeatures_management("temp_erase_layer")
-                        if arcpy.Exists("temp_erase_layer"):
-                            arcpy.Delete_management("temp_erase_layer")
+            processed_pairs = set()
 
-                        if verbose:
-                            print_info("          Removed OBJECTID {} - no geometry left after erase".format(oid2))
-                        return True
-                    except Exception as e:
-                        if verbose:
-                            print_info("          Failed to remove OBJECTID {}: {}".format(oid2, e))
-                        return False
+            for i, j in candidate_pairs:
+                # Extract OBJECTID and geometry - same as validate
+                oid1 = geometries[i][0]
+                oid2 = geometries[j][0]
+                geom1 = geometries[i][1]
+                geom2 = geometries[j][1]
 
-            finally:
-                # Clean up temporary files
-                for temp_path in [temp_feature1, temp_feature2, temp_buffered, temp_erased, "temp_erase_layer"]:
-                    if arcpy.Exists(temp_path):
-                        try:
-                            arcpy.Delete_management(temp_path)
-                        except:
-                            pass
+                # Skip invalid geometries
+                if not geom1 or not geom2:
+                    continue
 
-            return False
+                # Create ordered pair to avoid duplicates
+                pair = tuple(sorted([oid1, oid2]))
+                if pair in processed_pairs:
+                    continue
+                processed_pairs.add(pair)
 
-        except Exception as e:
-            if verbose:
-                print_info("          Error in buffer-erase operation: {}".format(e))
-            return False
+                try:
+                    # Check if this pair was detected by ArcPy method
+                    arcpy_detected = pair in arcpy_intersect_pairs
 
-    def _verify_overlap_resolved(self, input_fc, oid1, oid2, verbose=False):
-        """Verify if the overlap between two features has been resolved"""
-        try:
-            import arcpy
+                    # Method 1: ArcPy detection using [intersect analysis] (most reliable)
+                    if arcpy_detected:
+                        overlap_type = "arcpy_intersect"
 
-            # Check if both features still exist
-            layer1 = "temp_check_layer1_{}".format(oid1)
-            layer2 = "temp_check_layer2_{}".format(oid2)
+                    # Methods 2-4 (overlaps, intersection area, containment) all need the two
+                    # interiors to intersect, and a pair that only touches (method 5) is never
+                    # reported. That is the DE-9IM pattern "T********", so one relate() call
+                    # replaces the disjoint/overlaps/intersect/contains predicates
+                    elif geom1.relate(geom2, "T********"):
+                        overlap_type = "interior_intersect"
 
-            try:
-                arcpy.management.MakeFeatureLayer(input_fc, layer1, "OBJECTID = {}".format(oid1))
-                arcpy.management.MakeFeatureLayer(input_fc, layer2, "OBJECTID = {}".format(oid2))
+                    else:
+                        continue
 
-                count1 = int(arcpy.management.GetCount(layer1)[0])
-                count2 = int(arcpy.management.GetCount(layer2)[0])
+                    # Overlap detected, record it - same logic as validate
+                    overlap_pairs.append(pair)
 
-                # If either feature was completely removed during erase operation, overlap is resolved
-                if count1 == 0 or count2 == 0:
                     if verbose:
-                        print_info("          Feature removed during erase - overlap resolved")
-                    return True
+                        # The intersection is only needed for the reported overlap area
+                        intersect_geom = geom1.intersect(geom2, 4)
+                        overlap_area = intersect_geom.area if intersect_geom else 0.0
 
-                # Check for intersection between remaining features
-                arcpy.management.SelectLayerByLocation(layer2, "INTERSECT", layer1, "", "NEW_SELECTION")
-                intersect_count = int(arcpy.management.GetCount(layer2)[0])
+                        # Calculate overlap statistics
+                        min_area = min(areas[i], areas[j])
+                        overlap_percent = (overlap_area / min_area * 100) if min_area > 0 else 0
 
-                if verbose:
-                    print_info("          Intersection check: {} overlapping features".format(intersect_count))
+                        # Enhanced messaging with bracket analysis
+                        if overlap_type == "arcpy_intersect":
+                            method_desc = "overlapping polygons using [intersect analysis] (ArcPy)"
+                        else:
+                            method_desc = "overlapping polygons using [relate geometry] analysis"
 
-                return intersect_count == 0
+                        print_info("      Found {}: OBJECTID {} & OBJECTID {} - area: {:.2f} ({:.1f}%)".format(
+                            method_desc, oid1, oid2, overlap_area, overlap_percent))
 
-            finally:
-                # Clean up temporary layers
-                for layer in [layer1, layer2]:
-                    try:
-                        arcpy.management.Delete(layer)
-                    except:
-                        pass
+                except Exception as geom_error:
+                    if verbose:
+                        print_info("      Geometry comparison error between OBJECTID {} and {}: {}".format(oid1, oid2, str(geom_error)))
+                    continue
+
+            print_info("    Comprehensive detection found {} overlapping pairs".format(len(overlap_pairs)))
+            return overlap_pairs
 
         except Exception as e:
-            if verbose:
-                print_info("          Error verifying overlap resolution: {}".format(e))
-            return False
+            print_info("    Error detecting overlapping pairs: {}".format(e))
+            return []
+
+    def _envelope_candidate_pairs(self, boxes):
+        """
+        Find index pairs whose extents intersect using a sort-and-sweep over XMin
+
+        Args:
+            boxes (list): (XMin, YMin, XMax, YMax) tuples, one per feature
+
+        Returns:
+            list: Sorted (i, j) index pairs with i < j, touching extents included
+        """
+        import numpy as np
+
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        order = np.argsort(boxes[:, 0], kind='mergesort')
+        xmin = boxes[order, 0]
+        ymin = boxes[order, 1]
+        xmax = boxes[order, 2]
+        ymax = boxes[order, 3]
+
+        # Boxes after k (in XMin order) up to ends[k] start before box k ends along X
+        ends = np.searchsorted(xmin, xmax, side='right')
+
+        candidate_pairs = []
+        for k in range(len(order)):
+            lo = k + 1
+            hi = ends[k]
+            if hi <= lo:
+                continue
+
+            # Y-extent test for the whole X window in one array operation
+            mask = (ymin[lo:hi] <= ymax[k]) & (ymax[lo:hi] >= ymin[k])
+            i = int(order[k])
+            for j in order[lo:hi][mask].tolist():
+                candidate_pairs.append((i, j) if i < j else (j, i))
+
+        candidate_pairs.sort()
+        return candidate_pairs
+
+    def _verify_overlaps_resolved_bulk(self, input_fc, pairs):
+        """
+        Return the pairs whose features still intersect
+
+        Reads every feature of the pairs with one cursor per OBJECTID batch instead of
+        building layers and running SelectLayerByLocation for each pair. A pair where
+        either feature was removed during erase counts as resolved.
+
+        Args:
+            input_fc (str): Path to input feature class
+            pairs (list): (oid1, oid2) pairs to check
+
+        Returns:
+            set: Pairs that still intersect
+        """
+
+        oids = set()
+        for oid1, oid2 in pairs:
+            oids.add(oid1)
+            oids.add(oid2)
+
+        geometries = {}
+        boxes = {}
+        for where_clause in self._oid_where_clauses(oids):
+            with arcpy.da.SearchCursor(input_fc, ["OID@", "SHAPE@"], where_clause) as cursor:
+                for oid, geom in cursor:
+                    if geom:
+                        geometries[oid] = geom
+                        extent = geom.extent
+                        boxes[oid] = (extent.XMin, extent.YMin, extent.XMax, extent.YMax)
+
+        unresolved = set()
+        for oid1, oid2 in pairs:
+            geom1 = geometries.get(oid1)
+            geom2 = geometries.get(oid2)
+            if geom1 is None or geom2 is None:
+                continue
+
+            # Buffer-erase usually pulls the pair apart - separate envelopes settle it
+            # without asking the geometry engine
+            box1 = boxes[oid1]
+            box2 = boxes[oid2]
+            if box1[2] < box2[0] or box2[2] < box1[0] or box1[3] < box2[1] or box2[3] < box1[1]:
+                continue
+
+            if not geom1.disjoint(geom2):
+                unresolved.add((oid1, oid2))
+
+        return unresolved
 
     def _recreate_globalid_field(self, input_fc, verbose=False):
         """Recreate soi_uniq_id GlobalID field after sanitization operations"""
         try:
-            import arcpy
-            import uuid
 
             print_info("    Checking soi_uniq_id field...")
 
-            # Check if soi_uniq_id field exists
-            fields = [f.name for f in arcpy.ListFields(input_fc)]
+            # Read the field list once; the name lookup and type check share it
+            all_fields = dict((f.name.lower(), f) for f in arcpy.ListFields(input_fc))
+            soi_uniq_id = all_fields.get("soi_uniq_id")
 
-            if "soi_uniq_id" in fields:
-                # Check if it's a GlobalID field
-                field_type = None
-                for field in arcpy.ListFields(input_fc, "soi_uniq_id"):
-                    field_type = field.type
-                    break
+            if soi_uniq_id is not None:
+                if verbose:
+                    print_info("      Found existing soi_uniq_id field: {} ({})".format(soi_uniq_id.name, soi_uniq_id.type))
 
-                if field_type == "GlobalID":
+                # Check if it's a GlobalID field
+                if soi_uniq_id.type == "GlobalID":
                     print_info("    soi_uniq_id field already exists as GlobalID - no changes needed")
                     return True
                 else:
                     # Delete existing non-GlobalID soi_uniq_id field
                     print_info("    Removing existing soi_uniq_id field to recreate as GlobalID")
-                    arcpy.management.DeleteField(input_fc, "soi_uniq_id")
+                    arcpy.management.DeleteField(input_fc, soi_uniq_id.name)
                     if verbose:
                         print_info("      Deleted existing soi_uniq_id field")
 
-            # Check if soi_uniq_id field already exists and has GlobalID type
-            soi_uniq_id_exists = False
-            soi_uniq_id_type = None
-
-            for field in arcpy.ListFields(input_fc, "soi_uniq_id"):
-                soi_uniq_id_exists = True
-                soi_uniq_id_type = field.type
-                if verbose:
-                    print_info("      Found existing soi_uniq_id field: {} ({})".format(field.name, field.type))
-                break
-
-            if soi_uniq_id_exists:
-                if soi_uniq_id_type == "GlobalID":
-                    print_info("    soi_uniq_id field already exists as GlobalID type - no changes needed")
-                    return True
-                else:
-                    # Try to delete existing soi_uniq_id field if it's not a GlobalID type
-                    print_info("    soi_uniq_id field exists but type is {} - attempting to recreate".format(soi_uniq_id_type))
-                    try:
-                        arcpy.management.DeleteField(input_fc, "soi_uniq_id")
-                        if verbose:
-                            print_info("      Deleted existing soi_uniq_id field")
-                    except Exception as delete_error:
-                        print_info("    WARNING: Cannot delete soi_uniq_id field: {}".format(delete_error))
-                        print_info("    Continuing with existing field (may not be GlobalID type)")
-                        # Consider this acceptable - the field exists even if not perfect type
-                        return True
-
             # Create soi_uniq_id field with GlobalID data type manually
             print_info("    Creating soi_uniq_id field with GlobalID data type...")
 
-            # Try to add field with GlobalID type
+            # AddField raises when the field cannot be created, so no ListFields re-check is needed
             try:
                 arcpy.management.AddField(input_fc, "soi_uniq_id", "GUID")
-
-                # Verify the field was created
-                for field in arcpy.ListFields(input_fc, "soi_uniq_id"):
-                    if field.name == "soi_uniq_id":
-                        if field.type == "GUID":
-                            print_info("    Successfully created soi_uniq_id field with GUID data type")
-                            if verbose:
-                                print_info("      Field name: {}, Type: {}, Length: {}".format(field.name, field.type, field.length))
-                            return True
-                        else:
-                            print_info("    ERROR: soi_uniq_id field created but not as GUID type: {}".format(field.type))
-                            return False
-
             except Exception as field_error:
                 print_info("    ERROR creating soi_uniq_id field: {}".format(field_error))
                 return False
 
-            print_info("    ERROR: Failed to create soi_uniq_id field")
-            return False
+            print_info("    Successfully created soi_uniq_id field with GUID data type")
+            return True
 
         except Exception as e:
             print_info("    ERROR recreating GlobalID field: {}".format(e))
@@ -1759,7 +1790,6 @@ class PolygonSanitizer:
     def _renumber_plot_numbers(self, input_fc, verbose=False):
         """Renumber soi_plot_no and clr_plot_no fields sequentially after sanitization"""
         try:
-            import arcpy
 
             print_info("    Starting plot number renumbering...")
 
@@ -1791,9 +1821,8 @@ class PolygonSanitizer:
 
             # Get the sort order (prefer soi_drone_survey_date, then OBJECTID)
             sort_field = "OBJECTID"  # Default fallback
-            available_fields = [f.name for f in arcpy.ListFields(input_fc)]
 
-            if "soi_drone_survey_date" in available_fields:
+            if "soi_drone_survey_date" in fields:
                 sort_field = "soi_drone_survey_date"
                 if verbose:
                     print_info("      Using soi_drone_survey_date for sorting")
@@ -1801,44 +1830,40 @@ class PolygonSanitizer:
                 if verbose:
                     print_info("      Using OBJECTID for sorting (soi_drone_survey_date not found)")
 
-            # Create update field list
-            update_fields = [sort_field]
+            # Create update field list - the sort field is only used by the database
+            update_fields = []
             if soi_plot_field:
                 update_fields.append(soi_plot_field)
             if clr_plot_field:
                 update_fields.append(clr_plot_field)
 
-            if len(update_fields) == 1:  # Only sort field, no plot fields
+            if not update_fields:
                 print_info("      WARNING: No plot fields found to renumber")
                 return True
 
-            # Get features in sorted order and renumber
-            with arcpy.da.UpdateCursor(input_fc, update_fields) as cursor:
-                plot_number = 1
-                for row in cursor:
-                    # Update soi_plot_no if field exists
-                    if soi_plot_field:
-                        soi_plot_index = update_fields.index(soi_plot_field)
-                        row[soi_plot_index] = plot_number
+            # The cursor only returns rows in sort_field order when asked to
+            order_clause = (None, "ORDER BY {} ASC".format(sort_field))
 
-                    # Update clr_plot_no if field exists
-                    if clr_plot_field:
-                        clr_plot_index = update_fields.index(clr_plot_field)
-                        row[clr_plot_index] = plot_number
+            # Every plot field gets the same number, so the written row is just the plot number
+            plot_field_count = len(update_fields)
 
-                    # Update the row
-                    cursor.updateRow(row)
-                    plot_number += 1
+            # Get features in sorted order and renumber, committing all rows in one edit operation
+            with arcpy.da.Editor(os.path.dirname(input_fc)):
+                with arcpy.da.UpdateCursor(input_fc, update_fields, sql_clause=order_clause) as cursor:
+                    plot_number = 1
+                    for row in cursor:
+                        cursor.updateRow((plot_number,) * plot_field_count)
+                        plot_number += 1
 
-                    if verbose and plot_number % 100 == 0:
-                        print_info("        Renumbered {} of {} plots".format(plot_number - 1, total_features))
+                        if verbose and plot_number % 100 == 0:
+                            print_info("        Renumbered {} of {} plots".format(plot_number - 1, total_features))
 
             print_info("    Successfully renumbered {} plots sequentially".format(total_features - 1))
 
             # Verify the renumbering
             if verbose:
                 print_info("      Verification: checking renumbered plot numbers")
-                with arcpy.da.SearchCursor(input_fc, update_fields[:1] + [f for f in update_fields[1:] if f]) as verify_cursor:
+                with arcpy.da.SearchCursor(input_fc, [sort_field] + update_fields, sql_clause=order_clause) as verify_cursor:
                     first_few = []
                     for i, row in enumerate(verify_cursor):
                         if i < 5:  # Show first 5
@@ -1853,39 +1878,32 @@ class PolygonSanitizer:
 
         except Exception as e:
             print_info("    ERROR renumbering plot numbers: {}".format(e))
-            import traceback
-            traceback.print_exc()
+            if verbose:
+                import traceback
+                traceback.print_exc()
             return False
 
     def _reset_objectids(self, input_fc, verbose=False):
         """Reset OBJECTIDs to start from 1 using safe copy-rename approach"""
         try:
-            import arcpy
 
             if verbose:
                 print_info("    Starting OBJECTID reset to start from 1...")
 
-            # Check current OBJECTID range
-            current_oids = []
-            with arcpy.da.SearchCursor(input_fc, ["OID@"]) as cursor:
-                for row in cursor:
-                    current_oids.append(row[0])
+            # Check current OBJECTID range in one streaming pass
+            feature_count, current_min, current_max, sequential = self._oid_sequence_stats(input_fc)
 
-            if not current_oids:
+            if feature_count == 0:
                 if verbose:
                     print_info("      No features found for OBJECTID reset")
                 return True
 
-            current_min = min(current_oids)
-            current_max = max(current_oids)
-
             if verbose:
                 print_info("      Current OBJECTID range: {} to {}".format(current_min, current_max))
-                print_info("      Total features: {}".format(len(current_oids)))
+                print_info("      Total features: {}".format(feature_count))
 
             # If OBJECTIDs already start from 1 and are sequential, skip reset
-            expected_oids = list(range(1, len(current_oids) + 1))
-            if current_oids == expected_oids:
+            if sequential:
                 if verbose:
                     print_info("      OBJECTIDs already start from 1 and are sequential - skipping reset")
                 return True
@@ -1905,73 +1923,56 @@ class PolygonSanitizer:
                 if arcpy.Exists(temp_path):
                     arcpy.management.Delete(temp_path)
 
-            if verbose:
-                print_info("      Creating backup copy...")
-
-            # Step 1: Copy original to backup (preserves original OBJECTIDs)
-            arcpy.management.CopyFeatures(input_fc, backup_fc_path)
-
             if verbose:
                 print_info("      Creating new feature class with sequential OBJECTIDs...")
 
-            # Step 2: Copy to new location to get sequential OBJECTIDs
+            # Step 1: Copy to new location to get sequential OBJECTIDs - the only full copy
             arcpy.management.CopyFeatures(input_fc, temp_fc_path)
 
-            # Verify the copy has sequential OBJECTIDs
-            temp_oids = []
-            with arcpy.da.SearchCursor(temp_fc_path, ["OID@"]) as cursor:
-                for row in cursor:
-                    temp_oids.append(row[0])
-
-            if verbose:
-                print_info("      New OBJECTID range: {} to {}".format(min(temp_oids), max(temp_oids)))
-
-            # Step 3: Replace original with the sequential one
+            # Step 2: Keep the original as the backup by renaming it (no data is copied)
             if verbose:
                 print_info("      Replacing original feature class...")
+            arcpy.management.Rename(input_fc, backup_fc_name)
 
-            # Delete original
-            arcpy.management.Delete(input_fc)
-
-            # Rename temp to original name
-            arcpy.management.Rename(temp_fc_path, fc_name)
+            # Step 3: Rename temp to original name, putting the original back if that fails
+            try:
+                arcpy.management.Rename(temp_fc_path, fc_name)
+            except Exception:
+                arcpy.management.Rename(backup_fc_path, fc_name)
+                raise
 
             # Verify the final result
-            final_oids = []
-            with arcpy.da.SearchCursor(input_fc, ["OID@"]) as cursor:
-                for row in cursor:
-                    final_oids.append(row[0])
+            final_count, final_min, final_max, final_sequential = self._oid_sequence_stats(input_fc)
 
-            expected_final_oids = list(range(1, len(final_oids) + 1))
-            if final_oids == expected_final_oids:
+            if final_sequential and final_count == feature_count:
                 if verbose:
                     print_info("      OBJECTID reset completed successfully")
-                    print_info("      Final OBJECTID range: {} to {}".format(min(final_oids), max(final_oids)))
+                    print_info("      Final OBJECTID range: {} to {}".format(final_min, final_max))
 
                 # Clean up backup file
-                if arcpy.Exists(backup_fc_path):
-                    arcpy.management.Delete(backup_fc_path)
-                    if verbose:
-                        print_info("      Cleaned up backup file")
+                arcpy.management.Delete(backup_fc_path)
+                if verbose:
+                    print_info("      Cleaned up backup file")
 
                 return True
             else:
                 # Restore from backup if reset failed
                 if verbose:
                     print_info("      OBJECTID reset failed - restoring from backup...")
-                if arcpy.Exists(backup_fc_path):
-                    arcpy.management.CopyFeatures(backup_fc_path, input_fc)
+                arcpy.management.Delete(input_fc)
+                arcpy.management.Rename(backup_fc_path, fc_name)
                 raise Exception("OBJECTID reset failed - sequential numbering not achieved")
 
         except Exception as e:
             print_info("    ERROR resetting OBJECTIDs: {}".format(e))
-            import traceback
-            traceback.print_exc()
+            if verbose:
+                import traceback
+                traceback.print_exc()
 
-            # Emergency cleanup - try to restore from backup if it exists
+            # Emergency cleanup - restore the renamed original if it is still the backup
             try:
-                if 'backup_fc_path' in locals() and arcpy.Exists(backup_fc_path):
-                    arcpy.management.CopyFeatures(backup_fc_path, input_fc)
+                if 'backup_fc_path' in locals() and arcpy.Exists(backup_fc_path) and not arcpy.Exists(input_fc):
+                    arcpy.management.Rename(backup_fc_path, os.path.basename(input_fc))
                     if verbose:
                         print_info("      Restored from backup due to error")
             except:
@@ -1979,72 +1980,139 @@ class PolygonSanitizer:
 
             # Clean up any temporary files
             try:
-                for temp_path in ['backup_fc_path', 'temp_fc_path']:
-                    if temp_path in locals() and arcpy.Exists(temp_path):
-                        arcpy.management.Delete(temp_path)
+                if 'temp_fc_path' in locals() and arcpy.Exists(temp_fc_path):
+                    arcpy.management.Delete(temp_fc_path)
             except:
                 pass
 
             return False
 
+    def _oid_sequence_stats(self, input_fc):
+        """
+        Scan OBJECTIDs once without building a list
+
+        Returns:
+            tuple: (count, min_oid, max_oid, sequential) where sequential means the
+                   OBJECTIDs are exactly 1..count in cursor order
+        """
+
+        count = 0
+        min_oid = None
+        max_oid = None
+        sequential = True
+
+        with arcpy.da.SearchCursor(input_fc, ["OID@"]) as cursor:
+            for oid, in cursor:
+                count += 1
+                if oid != count:
+                    sequential = False
+                if min_oid is None or oid < min_oid:
+                    min_oid = oid
+                if max_oid is None or oid > max_oid:
+                    max_oid = oid
+
+        return count, min_oid, max_oid, sequential
+
     def _extract_exterior_rings(self, geom, verbose=False):
         """Extract exterior rings from polygon geometry, removing interior rings (holes)"""
         try:
-            import arcpy
 
             if geom.type != "polygon":
                 return geom
 
-            # Collect all exterior rings
-            exterior_polygons = []
+            # Work on the WKB bytes so no Point/Array objects are built per vertex
+            exterior_wkb, exterior_area, exterior_count = self._largest_exterior_wkb(geom.WKB)
 
-            for part_index in range(geom.partCount):
-                part = geom.getPart(part_index)
-                if part:
-                    # Extract points for this part
-                    exterior_points = []
-                    for point in part:
-                        if point:
-                            exterior_points.append(point)
-                        else:
-                            # NULL separator indicates end of exterior ring, start of interior ring
-                            # Stop at first NULL to get only exterior ring
-                            break
+            if exterior_wkb is None:
+                return None
 
-                    # Create polygon from exterior points only
-                    if len(exterior_points) >= 3:
-                        try:
-                            exterior_poly = arcpy.Polygon(arcpy.Array(exterior_points))
-                            if not exterior_poly.isEmpty:
-                                exterior_polygons.append(exterior_poly)
-                        except:
-                            if verbose:
-                                print_warning("        Could not create exterior polygon from part {}".format(part_index))
+            # If we have multiple exterior polygons, return the largest
+            if exterior_count > 1 and verbose:
+                print_info("        Multiple exterior parts found, using largest (area: {:.1f})".format(exterior_area))
 
-            # If we have multiple exterior polygons, create multipart or return the largest
-            if not exterior_polygons:
-                return None
-            elif len(exterior_polygons) == 1:
-                return exterior_polygons[0]
-            else:
-                # Return the largest exterior polygon
-                largest_poly = max(exterior_polygons, key=lambda p: p.area)
-                if verbose:
-                    print_info("        Multiple exterior parts found, using largest (area: {:.1f})".format(largest_poly.area))
-                return largest_poly
+            return arcpy.FromWKB(bytearray(exterior_wkb), geom.spatialReference)
 
         except Exception as e:
             if verbose:
-                print_warning("        Error extracting exterior rings: {}".format(e))
+                print_info("        Error extracting exterior rings: {}".format(e))
             return None
 
+    def _largest_exterior_wkb(self, wkb):
+        """
+        Find the largest exterior ring in Polygon/MultiPolygon WKB
+
+        Ring bytes are copied unchanged into a new single-ring Polygon WKB; only the
+        ring areas are computed, with numpy over the coordinate buffer.
+
+        Args:
+            wkb (bytearray): Geometry WKB as returned by geom.WKB
+
+        Returns:
+            tuple: (polygon_wkb, area, exterior_count); polygon_wkb is None when no
+                   exterior ring has at least three distinct points
+        """
+        import struct
+        import numpy as np
+
+        wkb = bytes(wkb)
+
+        def read_header(offset):
+            endian = '<' if wkb[offset:offset + 1] == b'\x01' else '>'
+            geom_type = struct.unpack_from(endian + 'I', wkb, offset + 1)[0]
+            # ISO (1000s) and EWKB (high bit flags) encodings of Z and M
+            iso_dims = (geom_type & 0xFFFF) // 1000
+            has_z = bool(geom_type & 0x80000000) or iso_dims in (1, 3)
+            has_m = bool(geom_type & 0x40000000) or iso_dims in (2, 3)
+            return endian, (geom_type & 0xFFFF) % 1000, 2 + has_z + has_m, offset + 5
+
+        endian, base_type, dims, offset = read_header(0)
+        if base_type == 3:
+            polygon_count = 1
+        elif base_type == 6:
+            polygon_count = struct.unpack_from(endian + 'I', wkb, offset)[0]
+            offset += 4
+        else:
+            return None, 0.0, 0
+
+        best = (None, 0.0)
+        exterior_count = 0
+        polygon_offset = 0 if base_type == 3 else offset
+
+        for polygon_index in range(polygon_count):
+            endian, base_type, dims, offset = read_header(polygon_offset)
+            ring_count = struct.unpack_from(endian + 'I', wkb, offset)[0]
+            offset += 4
+
+            for ring_index in range(ring_count):
+                point_count = struct.unpack_from(endian + 'I', wkb, offset)[0]
+                ring_end = offset + 4 + point_count * dims * 8
+
+                # The first ring of each polygon is its exterior; the rest are holes
+                if ring_index == 0 and point_count >= 4:
+                    coords = np.frombuffer(wkb, dtype=endian + 'f8', count=point_count * dims,
+                                           offset=offset + 4).reshape(point_count, dims)
+                    x = coords[:, 0]
+                    y = coords[:, 1]
+                    area = abs(float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))) / 2.0
+                    exterior_count += 1
+
+                    if best[0] is None or area > best[1]:
+                        ring_wkb = (wkb[polygon_offset:polygon_offset + 5] + struct.pack(endian + 'I', 1) +
+                                    wkb[offset:ring_end])
+                        best = (ring_wkb, area)
+
+                offset = ring_end
+
+            polygon_offset = offset
+
+        return best[0], best[1], exterior_count
+
     def _remove_sliver_polygons(self, input_fc, verbose=False):
         """
         Remove sliver polygons using ArcPy Eliminate tool
         Slivers are small, thin polygons often created by overlay operations
         """
         try:
-            import arcpy
 
             if verbose:
                 print_info("    Detecting and removing sliver polygons...")
@@ -2065,16 +2133,17 @@ class PolygonSanitizer:
 
             # Create temporary feature class for sliver detection
             temp_fc = "in_memory\\temp_sliver_detection"
-            if arcpy.Exists(temp_fc):
-                arcpy.management.Delete(temp_fc)
 
             try:
                 # Copy features to temporary feature class
                 arcpy.management.CopyFeatures(input_fc, temp_fc)
 
+                # Names already present in the copy, read once for the three helper fields
+                existing_fields = set(f.name for f in arcpy.ListFields(temp_fc))
+
                 # Add field for area calculation
                 area_field = "POLY_AREA"
-                if area_field in [f.name for f in arcpy.ListFields(temp_fc)]:
+                if area_field in existing_fields:
                     arcpy.management.DeleteField(temp_fc, area_field)
 
                 arcpy.management.AddField(temp_fc, area_field, "DOUBLE")
@@ -2082,7 +2151,7 @@ class PolygonSanitizer:
 
                 # Add field for perimeter calculation
                 perimeter_field = "POLY_PERIMETER"
-                if perimeter_field in [f.name for f in arcpy.ListFields(temp_fc)]:
+                if perimeter_field in existing_fields:
                     arcpy.management.DeleteField(temp_fc, perimeter_field)
 
                 arcpy.management.AddField(temp_fc, perimeter_field, "DOUBLE")
@@ -2091,7 +2160,7 @@ class PolygonSanitizer:
                 # Calculate shape index (perimeter^2/4*pi*area) - circle has shape index of 1
                 # Higher values indicate more elongated shapes (slivers)
                 shape_index_field = "SHAPE_INDEX"
-                if shape_index_field in [f.name for f in arcpy.ListFields(temp_fc)]:
+                if shape_index_field in existing_fields:
                     arcpy.management.DeleteField(temp_fc, shape_index_field)
 
                 arcpy.management.AddField(temp_fc, shape_index_field, "DOUBLE")
@@ -2153,9 +2222,6 @@ class PolygonSanitizer:
 
                 # Create temporary layer for elimination
                 eliminate_layer = "temp_eliminate_layer"
-                if arcpy.Exists(eliminate_layer):
-                    arcpy.management.Delete(eliminate_layer)
-
                 arcpy.management.MakeFeatureLayer(temp_fc, eliminate_layer)
 
                 # Apply selection to eliminate only slivers
@@ -2165,50 +2231,42 @@ class PolygonSanitizer:
                 eliminated_fc = "in_memory\\temp_eliminated"
 
                 # Use Eliminate tool to merge slivers into neighboring polygons
-                # Eliminate merges selected features into neighboring features based on longest shared boundary
+                # Eliminate merges selected features into neighboring features based on longest shared boundary.
+                # A failed run raises, so the output is not probed with Exists afterwards.
                 arcpy.management.Eliminate(eliminate_layer, eliminated_fc)
 
-                # Verify elimination results
-                if arcpy.Exists(eliminated_fc):
-                    eliminated_count = int(arcpy.management.GetCount(eliminated_fc)[0])
-
-                    if eliminated_count > 0:
-                        if verbose:
-                            print_info("      Elimination successful: {} features after sliver removal".format(eliminated_count))
+                # Verify elimination results - the first row tells whether anything is left,
+                # so the output is read once instead of counted with GetCount first
+                eliminated_count = 0
+                with arcpy.da.SearchCursor(eliminated_fc, ["SHAPE@"] + [f.name for f in arcpy.ListFields(eliminated_fc) if f.name not in ["OID@", "SHAPE@"]]) as search_cursor:
+                    first_row = next(iter(search_cursor), None)
 
+                    if first_row is not None:
                         # Replace original feature class with eliminated version
                         # Delete all features in original and copy from eliminated
                         arcpy.management.DeleteFeatures(input_fc)
 
                         # Insert eliminated features back into original
-                        with arcpy.da.SearchCursor(eliminated_fc, ["SHAPE@"] + [f.name for f in arcpy.ListFields(eliminated_fc) if f.name not in ["OID@", "SHAPE@"]]) as search_cursor:
-                            with arcpy.da.InsertCursor(input_fc, ["SHAPE@"] + [f.name for f in arcpy.ListFields(input_fc) if f.name not in ["OID@", "SHAPE@"]]) as insert_cursor:
-                                for row in search_cursor:
-                                    insert_cursor.insertRow(row)
-
-                        if verbose:
-                            print_info("      Successfully updated original feature class")
-
-                    else:
-                        if verbose:
-                            print_info("      WARNING: Elimination produced no features")
-                        sliver_count = 0
+                        with arcpy.da.InsertCursor(input_fc, ["SHAPE@"] + [f.name for f in arcpy.ListFields(input_fc) if f.name not in ["OID@", "SHAPE@"]]) as insert_cursor:
+                            insert_cursor.insertRow(first_row)
+                            eliminated_count = 1
+                            for row in search_cursor:
+                                insert_cursor.insertRow(row)
+                                eliminated_count += 1
+
+                if eliminated_count > 0:
+                    if verbose:
+                        print_info("      Elimination successful: {} features after sliver removal".format(eliminated_count))
+                        print_info("      Successfully updated original feature class")
 
-                    # Clean up eliminated feature class
-                    arcpy.management.Delete(eliminated_fc)
                 else:
                     if verbose:
-                        print_info("      WARNING: Elimination failed - no output created")
+                        print_info("      WARNING: Elimination produced no features")
                     sliver_count = 0
 
-                # Clean up temporary layer
-                if arcpy.Exists(eliminate_layer):
-                    arcpy.management.Delete(eliminate_layer)
-
             finally:
-                # Clean up temporary feature class
-                if arcpy.Exists(temp_fc):
-                    arcpy.management.Delete(temp_fc)
+                # Clean up temporary feature class, elimination output and layer
+                self._delete_temp(temp_fc, "in_memory\\temp_eliminated", "temp_eliminate_layer")
 
             # Get final feature count
             final_count = int(arcpy.management.GetCount(input_fc)[0])
@@ -2237,6 +2295,50 @@ class PolygonSanitizer:
         return self.sanitize_feature_class(input_fc, verbose)
 
 
+class _OutputCapture(object):
+    """Minimal stdout replacement that keeps everything written to it"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self.parts)
+
+
+def _sanitize_worker(task):
+    """Sanitize one feature class in a worker process (module level so it can be pickled)"""
+    fc_path, options = task
+    # Spawned workers never run setup_logging, so their output is returned to the parent
+    capture = _OutputCapture()
+    stdout = sys.stdout
+    sys.stdout = capture
+    try:
+        success, message, feature_count = PolygonSanitizer().sanitize_feature_class(fc_path, **options)
+    except Exception as e:
+        success, message, feature_count = False, "Sanitization failed: {}".format(e), 0
+    finally:
+        sys.stdout = stdout
+    return fc_path, success, message, feature_count, capture.getvalue()
+
+
+def _resolve_pair_worker(task):
+    """Compute the buffer-erase result for one overlapping pair in a worker process"""
+    input_fc, oid1, oid2, buffer_erase_cm = task
+    try:
+        oid1, oid2, resolved, action, geometry = PolygonSanitizer()._compute_pair_buffer_erase(
+            input_fc, oid1, oid2, buffer_erase_cm)
+        # Geometries are sent back to the parent as Esri JSON
+        return oid1, oid2, resolved, action, geometry.JSON if geometry is not None else None
+    except Exception:
+        return oid1, oid2, False, None, None
+
+
 # Alias for backward compatibility
 def print_info(msg):
     """Print info message"""
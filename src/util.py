@@ -5,12 +5,18 @@
 Utility functions for file operations, error handling, and survey unit matching
 """
 
+import errno
 import os
 import shutil
+import stat
 import tempfile
 import traceback
 import json
 from datetime import datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class FileOps:
@@ -19,11 +25,16 @@ class FileOps:
     @staticmethod
     def ensure_dir_exists(path):
         """Ensure directory exists, create if necessary"""
+        # Create first and treat EEXIST as success - no separate exists check to race with
         try:
-            if not os.path.exists(path):
-                os.makedirs(path)
-                print_verbose_info("Created directory: {}".format(path))
+            os.makedirs(path)
+            print_verbose_info("Created directory: {}", path)
             return True
+        except OSError as e:
+            if e.errno == errno.EEXIST and os.path.isdir(path):
+                return True
+            print_error("Error creating directory {}: {}".format(path, e))
+            return False
         except Exception as e:
             print_error("Error creating directory {}: {}".format(path, e))
             return False
@@ -39,14 +50,11 @@ class FileOps:
     @staticmethod
     def validate_gdb_file(gdb_path):
         """Validate geodatabase file"""
+        if not gdb_path.endswith('.gdb'):
+            return False
+        # One stat answers both "exists" and "is a directory"
         try:
-            if not os.path.exists(gdb_path):
-                return False
-            if not gdb_path.endswith('.gdb'):
-                return False
-            if not os.path.isdir(gdb_path):
-                return False
-            return True
+            return stat.S_ISDIR(os.stat(gdb_path).st_mode)
         except Exception:
             return False
 
@@ -69,10 +77,15 @@ class FileOps:
     def safe_remove_file(file_path):
         """Safely remove file with error handling"""
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                print_verbose_info("Removed file: {}".format(file_path))
+            os.remove(file_path)
+            print_verbose_info("Removed file: {}", file_path)
             return True
+        except OSError as e:
+            # Already gone counts as removed
+            if e.errno == errno.ENOENT:
+                return True
+            print_error("File removal error: {}".format(e))
+            return False
         except Exception as e:
             print_error("File removal error: {}".format(e))
             return False
@@ -81,11 +94,13 @@ class FileOps:
     def safe_remove_dir(dir_path, rm_contents=False):
         """Safely remove directory with error handling"""
         try:
-            if not os.path.exists(dir_path):
+            try:
+                st = os.stat(dir_path)
+            except OSError:
                 return True
-            if rm_contents and os.path.isdir(dir_path):
+            if rm_contents and stat.S_ISDIR(st.st_mode):
                 shutil.rmtree(dir_path)
-                print_verbose_info("Removed directory: {}".format(dir_path))
+                print_verbose_info("Removed directory: {}", dir_path)
             return True
         except Exception as e:
             print_error("Directory removal error: {}".format(e))
@@ -95,9 +110,7 @@ class FileOps:
     def get_file_size(file_path):
         """Get file size in bytes"""
         try:
-            if os.path.exists(file_path):
-                return os.path.getsize(file_path)
-            return 0
+            return os.stat(file_path).st_size
         except Exception:
             return 0
 
@@ -131,22 +144,37 @@ class FileOps:
         """Join multiple path components"""
         return os.path.join(*paths)
 
+    @staticmethod
+    def _last_sep(file_path):
+        """Index of the last path separator, -1 if none (string search instead of os.path)"""
+        return max(file_path.rfind('/'), file_path.rfind(os.sep))
+
+    @staticmethod
+    def _ext_dot(name):
+        """Index of the extension dot in a file name, -1 if none; leading dots are not extensions, as in splitext"""
+        dot = name.rfind('.')
+        return dot if dot > 0 and name[:dot].lstrip('.') else -1
+
     @staticmethod
     def get_file_ext(file_path):
         """Get file extension without dot"""
-        _, ext = os.path.splitext(file_path)
-        return ext[1:] if ext else ""
+        name = file_path[FileOps._last_sep(file_path) + 1:]
+        dot = FileOps._ext_dot(name)
+        return name[dot + 1:] if dot >= 0 else ""
 
     @staticmethod
     def get_file_basename(file_path):
         """Get filename without extension"""
-        return os.path.splitext(os.path.basename(file_path))[0]
+        name = file_path[FileOps._last_sep(file_path) + 1:]
+        dot = FileOps._ext_dot(name)
+        return name[:dot] if dot >= 0 else name
 
     @staticmethod
     def is_file_readable(file_path):
         """Check if file is readable"""
         try:
-            return os.path.exists(file_path) and os.access(file_path, os.R_OK)
+            # os.access is already False for a missing file
+            return os.access(file_path, os.R_OK)
         except Exception:
             return False
 
@@ -157,7 +185,8 @@ class FileOps:
             if os.path.exists(file_path):
                 return os.access(file_path, os.W_OK)
             else:
-                parent_dir = os.path.dirname(file_path)
+                head = file_path[:FileOps._last_sep(file_path) + 1]
+                parent_dir = head.rstrip('/' + os.sep) or head
                 return os.path.exists(parent_dir) and os.access(parent_dir, os.W_OK)
         except Exception:
             return False
@@ -254,17 +283,13 @@ class SurveyMatch:
     @staticmethod
     def find_by_sryunit_code(hierarchical_data, sryunit_code, verbose=False):
         """Find hierarchical data by exact survey unit code match"""
+        # Compare inline so block_sryunit is only read when SurveyUnitCode does not match
         for data in hierarchical_data:
-            survey_unit_code = data.get('SurveyUnitCode', '')
-            block_sryunit = data.get('block_sryunit', '')
-
-            if survey_unit_code == sryunit_code or block_sryunit == sryunit_code:
-                if verbose:
-                    print_verbose_info("Direct match: {}".format(sryunit_code))
+            if data.get('SurveyUnitCode', '') == sryunit_code or data.get('block_sryunit', '') == sryunit_code:
+                print_verbose_info("Direct match: {}", sryunit_code, verbose=verbose)
                 return data
 
-        if verbose:
-            print_verbose_info("No direct match found: {}".format(sryunit_code))
+        print_verbose_info("No direct match found: {}", sryunit_code, verbose=verbose)
         return None
 
     @staticmethod
@@ -279,16 +304,11 @@ class SurveyMatch:
 
         # Strategy 2: Exact match by block name (new format: "1", "2", etc.)
         for data in hierarchical_data:
-            survey_unit = data.get('SurveyUnit', '')
-            block = data.get('block', '')
-
-            if survey_unit == search_term or block == search_term:
-                if verbose:
-                    print_verbose_info("Block name match: {} -> {}".format(search_term, data.get('SurveyUnitCode')))
+            if data.get('SurveyUnit', '') == search_term or data.get('block', '') == search_term:
+                print_verbose_info("Block name match: {} -> {}", search_term, data.get('SurveyUnitCode'), verbose=verbose)
                 return data
 
-        if verbose:
-            print_verbose_info("No match found: {}".format(search_term))
+        print_verbose_info("No match found: {}", search_term, verbose=verbose)
         return None
 
     @staticmethod
@@ -298,12 +318,23 @@ class SurveyMatch:
         invalid_codes = []
         valid_data = []
 
+        # One pass over the records, keeping only the first match of each wanted code
+        wanted = set(sryunit_codes)
+        found = {}
+        for data in hierarchical_data:
+            for key in ('SurveyUnitCode', 'block_sryunit'):
+                value = data.get(key, '')
+                if value in wanted and value not in found:
+                    found[value] = data
+
         for code in sryunit_codes:
-            match = SurveyMatch.find_by_sryunit_code(hierarchical_data, code, verbose)
+            match = found.get(code)
             if match:
+                print_verbose_info("Direct match: {}", code, verbose=verbose)
                 valid_codes.append(code)
                 valid_data.append(match)
             else:
+                print_verbose_info("No direct match found: {}", code, verbose=verbose)
                 invalid_codes.append(code)
 
         result = {
@@ -315,31 +346,29 @@ class SurveyMatch:
             'invalid_count': len(invalid_codes)
         }
 
-        if verbose:
-            print_verbose_info("Validation: {}/{} codes valid".format(
-                result['valid_count'], result['total']))
+        print_verbose_info("Validation: {}/{} codes valid", result['valid_count'], result['total'], verbose=verbose)
 
         return result
 
     @staticmethod
     def get_unique_wards(hierarchical_data):
         """Get list of unique wards from hierarchical data"""
+        # Only the first record of each ward is read; a tuple per ward, dicts built once at the end
         wards = {}
         for data in hierarchical_data:
             ward_code = data.get('WardCode', '')
-            ward_name = data.get('Ward', '')
-            state_code = data.get('StateCode', '')
-            district_code = data.get('DistrictCode', '')
-            ulb_code = data.get('UlbCode', '')
-
             if ward_code and ward_code not in wards:
-                wards[ward_code] = {
-                    'WardCode': ward_code, 'Ward': ward_name,
-                    'StateCode': state_code, 'DistrictCode': district_code,
-                    'UlbCode': ulb_code
-                }
+                wards[ward_code] = (data.get('Ward', ''), data.get('StateCode', ''),
+                                    data.get('DistrictCode', ''), data.get('UlbCode', ''))
 
-        return list(wards.values())
+        return [{'WardCode': ward_code, 'Ward': ward_name,
+                 'StateCode': state_code, 'DistrictCode': district_code,
+                 'UlbCode': ulb_code}
+                for ward_code, (ward_name, state_code, district_code, ulb_code) in wards.items()]
+
+
+# Config path -> (mtime, size, parsed config); one entry per path, so an edit replaces the old one
+_CONFIG_CACHE = {}
 
 
 class ConfigLoader:
@@ -349,6 +378,8 @@ class ConfigLoader:
         self.config_file = config_file
         self.config_data = {}
         self._load_config()
+        # Bound config_data.get for the getters; refreshed whenever config_data is replaced
+        self._get = self.config_data.get
 
     def _load_config(self):
         """Load configuration from input.json file"""
@@ -357,9 +388,20 @@ class ConfigLoader:
             config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', self.config_file)
 
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    self.config_data = json.load(f)
-                print_verbose_info("Configuration loaded from: {}".format(config_path))
+                # Re-parse only when the file changed since it was last loaded
+                st = os.stat(config_path)
+                cached = _CONFIG_CACHE.get(config_path)
+                if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+                    # Each loader gets its own dict so one loader's edits never reach another
+                    self.config_data = dict(cached[2])
+                    return
+
+                # One read and one parse; orjson when installed, the stdlib parser otherwise
+                with open(config_path, 'rb') as f:
+                    raw = f.read()
+                self.config_data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+                _CONFIG_CACHE[config_path] = (st.st_mtime, st.st_size, dict(self.config_data))
+                print_verbose_info("Configuration loaded from: {}", config_path)
             else:
                 print_error("Configuration file not found: {}".format(config_path))
                 # Set default values
@@ -377,19 +419,23 @@ class ConfigLoader:
 
     def get_wkid(self):
         """Get WKID from configuration"""
-        return self.config_data.get("wkid", 32644)
+        return self._get("wkid", 32644)
 
     def get_flown_date(self):
         """Get drone flown date from configuration"""
-        return self.config_data.get("flown", datetime.now().strftime("%d-%m-%Y"))
+        # The default date is only formatted when the key is missing
+        if "flown" in self.config_data:
+            return self.config_data["flown"]
+        return datetime.now().strftime("%d-%m-%Y")
 
     def get_config_value(self, key, default=None):
         """Get specific configuration value"""
-        return self.config_data.get(key, default)
+        return self._get(key, default)
 
     def reload_config(self):
-        """Reload configuration from file"""
+        """Reload configuration from file (no re-parse when the file is unchanged)"""
         self._load_config()
+        self._get = self.config_data.get
 
 
 # Global configuration instance
@@ -407,6 +453,12 @@ def get_config():
 def print_error(msg):
     print("ERROR: {}".format(msg))
 
-def print_verbose_info(msg, verbose=False):
-    if verbose:
-        print("INFO: {}".format(msg))
\ No newline at end of file
+def print_verbose_info(msg, *args, **kwargs):
+    """
+    Print msg.format(*args) when verbose=True
+
+    verbose must be passed as a keyword - a second positional argument is a format
+    argument. Formatting only happens when printing, so quiet calls build no string.
+    """
+    if kwargs.get('verbose', False):
+        print("INFO: {}".format(msg.format(*args) if args else msg))
\ No newline at end of file
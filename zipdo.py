@@ -1,13 +1,104 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import errno
 import os
 import zipfile
 import sys
 import argparse
+import multiprocessing
+import time
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# Files up to this size are read in one call and stored with writestr
+_SMALL_FILE_BYTES = 64 * 1024
+
+def _open_zip(zip_path, compression, compresslevel=None):
+    """Open a ZIP for writing, applying compresslevel where zipfile supports it (Python 3.7+)"""
+    if compresslevel is not None and compression == zipfile.ZIP_DEFLATED:
+        try:
+            return zipfile.ZipFile(zip_path, 'w', compression, compresslevel=compresslevel)
+        except TypeError:
+            pass
+    return zipfile.ZipFile(zip_path, 'w', compression)
+
+def _iter_files(gdb_path):
+    """Yield (file_path, arcname) for every file under gdb_path"""
+    # The relative prefix is worked out once per directory instead of os.path.relpath per file
+    gdb_path = gdb_path.rstrip(os.sep)
+    root_len = len(gdb_path) + 1
+    for root, dirs, files in os.walk(gdb_path):
+        rel_root = root[root_len:]
+        prefix = rel_root + os.sep if rel_root else ''
+        root_prefix = root + os.sep
+        for file in files:
+            yield root_prefix + file, prefix + file
+
+def _write_file(zipf, file_path, arcname):
+    """Add one file to the ZIP; small files are read whole instead of streamed in 8KB chunks"""
+    st = os.stat(file_path)
+    if st.st_size > _SMALL_FILE_BYTES:
+        zipf.write(file_path, arcname)
+        return
 
-def zip_gdb_folders(gdb_folder='data/gdbs', use_backup=False):
-    """Zip GDB folders in the specified directory"""
+    try:
+        zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    except ValueError:
+        # ZIP timestamps start in 1980; zipf.write knows how to handle older files
+        zipf.write(file_path, arcname)
+        return
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = zipf.compression
+
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    # ZipInfo does not carry the archive's compresslevel (Python 3.7+), so pass it along
+    compresslevel = getattr(zipf, 'compresslevel', None)
+    if compresslevel is not None:
+        zipf.writestr(zinfo, data, compresslevel=compresslevel)
+    else:
+        zipf.writestr(zinfo, data)
+
+def _list_gdb_folders(gdb_folder):
+    """Names of the .gdb directories in gdb_folder"""
+    # scandir (Python 3.5+) reports the entry type from the directory listing itself;
+    # otherwise stat only the .gdb names rather than every entry
+    scandir = getattr(os, 'scandir', None)
+    if scandir is not None:
+        return [entry.name for entry in scandir(gdb_folder)
+                if entry.name.endswith('.gdb') and entry.is_dir()]
+    return [f for f in os.listdir(gdb_folder)
+            if f.endswith('.gdb') and os.path.isdir(os.path.join(gdb_folder, f))]
+
+def _init_zip_worker():
+    """Pool initializer: use ISA-L's CRC32 for zipfile inside the zip worker processes"""
+    # ISA-L's crc32 is a drop-in for zlib.crc32 with the same (data, value) signature, and
+    # zipfile runs it over every byte, stored or deflated. The swap is confined to these
+    # dedicated worker processes; ISA-L's deflate only has levels 0-3, so DEFLATE stays on zlib.
+    if isal_zlib is not None:
+        zipfile.crc32 = isal_zlib.crc32
+
+def _zip_one(task):
+    """Zip one GDB folder in a worker process, returning (gdb_folder_name, ok, error)"""
+    gdb_folder_name, gdb_path, zip_path, compression, compresslevel = task
+    try:
+        # Create ZIP file
+        with _open_zip(zip_path, compression, compresslevel) as zipf:
+            # Add all files and subdirectories from the GDB folder
+            for file_path, arcname in _iter_files(gdb_path):
+                _write_file(zipf, file_path, arcname)
+
+        return gdb_folder_name, True, None
+    except Exception as e:
+        return gdb_folder_name, False, str(e)
+
+def zip_gdb_folders(gdb_folder='data/gdbs', use_backup=False, workers=None,
+                    compression=zipfile.ZIP_DEFLATED, compresslevel=None):
+    """Zip GDB folders in the specified directory, one worker process per GDB (default: CPU count)"""
     try:
         # Validate input folder
         if not os.path.exists(gdb_folder):
@@ -17,42 +108,44 @@ def zip_gdb_folders(gdb_folder='data/gdbs', use_backup=False):
         # Determine output directory
         if use_backup:
             output_dir = os.path.join(gdb_folder, 'backup')
-            # Create backup directory if it doesn't exist
-            if not os.path.exists(output_dir):
+            # Create backup directory if it doesn't exist (EEXIST means it already does)
+            try:
                 os.makedirs(output_dir)
                 print("Created backup directory: {}".format(output_dir))
+            except OSError as e:
+                if e.errno != errno.EEXIST or not os.path.isdir(output_dir):
+                    raise
         else:
             output_dir = gdb_folder
 
         # Find GDB folders
-        gdb_folders = [f for f in os.listdir(gdb_folder)
-                      if os.path.isdir(os.path.join(gdb_folder, f)) and f.endswith('.gdb')]
+        gdb_folders = _list_gdb_folders(gdb_folder)
 
         if not gdb_folders:
             print("No GDB folders found")
             return False
 
-        success_count = 0
-        failure_count = 0
-
         print("Zipping GDB folders to: {}".format(output_dir))
-        for gdb_folder_name in gdb_folders:
-            gdb_path = os.path.join(gdb_folder, gdb_folder_name)
-            zip_path = os.path.join(output_dir, "{}.zip".format(gdb_folder_name))
-
+        tasks = [(gdb_folder_name,
+                  os.path.join(gdb_folder, gdb_folder_name),
+                  os.path.join(output_dir, "{}.zip".format(gdb_folder_name)),
+                  compression, compresslevel)
+                 for gdb_folder_name in gdb_folders]
+
+        # DEFLATE is CPU-bound and holds the GIL, so GDBs are zipped in separate processes
+        workers = min(workers or multiprocessing.cpu_count(), len(tasks))
+        if workers > 1:
+            pool = multiprocessing.Pool(processes=workers, initializer=_init_zip_worker)
             try:
-                # Create ZIP file
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add all files and subdirectories from the GDB folder
-                    for root, dirs, files in os.walk(gdb_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, gdb_path)
-                            zipf.write(file_path, arcname)
-
-                success_count += 1
-            except Exception as e:
-                failure_count += 1
+                results = pool.map(_zip_one, tasks, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_zip_one(task) for task in tasks]
+
+        success_count = sum(1 for gdb_folder_name, ok, error in results if ok)
+        failure_count = len(results) - success_count
 
         print("Created {} ZIPs, {} failed".format(success_count, failure_count))
         return success_count > 0
@@ -70,11 +163,19 @@ def main():
                        help='GDB folder path (default: data/gdbs)')
     parser.add_argument('--uploaded-gdbs', action='store_true',
                        help='Zip to data/gdbs/backup folder instead of data/gdbs')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Number of parallel zip processes (default: CPU count)')
+    parser.add_argument('--fast', action='store_true',
+                       help='Use fastest DEFLATE level 1 (slightly larger ZIPs, Python 3.7+)')
+    parser.add_argument('--store', action='store_true',
+                       help='Store files without compression')
 
     args = parser.parse_args()
 
     # Call zip function with appropriate arguments
-    success = zip_gdb_folders(args.gdb_folder, args.uploaded_gdbs)
+    compression = zipfile.ZIP_STORED if args.store else zipfile.ZIP_DEFLATED
+    compresslevel = 1 if args.fast else None
+    success = zip_gdb_folders(args.gdb_folder, args.uploaded_gdbs, args.workers, compression, compresslevel)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":